@@ -1,11 +1,13 @@
 # src/ai.py
 from __future__ import annotations
-import random, math
+import random, math, re, time
+from operator import itemgetter
 from typing import Tuple, List, Optional, Iterable
 from models import GameState
 
-# We treat blocked cells like "walls" when scanning (breaks lines).
-SENT_WALL = "|"
+# Cell codes of the flat AI board. Blocked cells are walls (they break lines).
+EMPTY, X_CODE, O_CODE, WALL = 0, 1, 2, 3
+PIECE_CODE = {"X": X_CODE, "O": O_CODE}
 
 WEIGHTS = {
     # pattern scores (bigger = stronger for CPU)
@@ -19,6 +21,102 @@ WEIGHTS = {
     "ONE":                 10,
 }
 
+# Zobrist keys for incremental position hashing: ZOB[code][r*n + c] -> 64-bit int.
+# Drawn from a private RNG so importing this module leaves `random` untouched.
+_MAX_CELLS = 19 * 19
+_zob_rng = random.Random(0x5EED)
+ZOB = [None] + [[_zob_rng.getrandbits(64) for _ in range(_MAX_CELLS)] for _code in (X_CODE, O_CODE)]
+
+# Hard CPU: iterative deepening up to this depth, no new iteration once the budget (s) is spent
+HARD_MAX_DEPTH = 2
+HARD_TIME_BUDGET = 0.5
+
+# Root moves are folded by board symmetry while fewer stones than this are down
+SYMMETRY_MAX_STONES = 3
+
+# Transposition-table entry flags
+TT_EXACT, TT_LOWER, TT_UPPER = 0, 1, 2
+
+# Move-ordering memory, reset at the start of every search (kept across its deepening passes):
+# KILLERS[depth] = last two moves that caused a cutoff there, HIST[(r, c, piece)] = sum of depth^2 on cutoffs
+KILLERS = {}
+HIST = {}
+
+class AIBoard:
+    """
+    Flat mirror of a GameState grid for the search: cells[r*n + c] holds a cell code.
+    Blocked cells are stored as WALL, so the search needs no separate blocked set.
+    """
+    __slots__ = ("n", "cells")
+
+    def __init__(self, n: int, cells: bytearray):
+        self.n = n
+        self.cells = cells
+
+    @classmethod
+    def from_state(cls, state: GameState) -> "AIBoard":
+        n = state.board_size
+        cells = bytearray(n * n)
+        for r, row in enumerate(state.grid):
+            base = r * n
+            for c, v in enumerate(row):
+                if v is not None:
+                    cells[base + c] = PIECE_CODE.get(v, WALL)  # '#' and friends block like walls
+        for r, c in state.blocked_expiry:
+            cells[r * n + c] = WALL
+        return cls(n, cells)
+
+    def copy(self) -> "AIBoard":
+        return AIBoard(self.n, self.cells[:])
+
+class Candidates:
+    """
+    Search candidates kept incrementally: counts[(r, c)] = stones within `radius`.
+    Update with add_stone/remove_stone around every make/unmake in the search.
+    """
+    __slots__ = ("n", "radius", "counts")
+
+    def __init__(self, n: int, radius: int = 2):
+        self.n = n
+        self.radius = radius
+        self.counts = {}
+
+    @classmethod
+    def from_board(cls, board: AIBoard, radius: int = 2) -> "Candidates":
+        cands = cls(board.n, radius)
+        n, cells = board.n, board.cells
+        for i, v in enumerate(cells):
+            if v == X_CODE or v == O_CODE:
+                cands.add_stone(i // n, i % n)
+        return cands
+
+    def _neighbourhood(self, sr: int, sc: int):
+        n, rad = self.n, self.radius
+        return [(r, c) for r in range(max(0, sr - rad), min(n, sr + rad + 1))
+                       for c in range(max(0, sc - rad), min(n, sc + rad + 1))]
+
+    def add_stone(self, r: int, c: int) -> None:
+        counts = self.counts
+        for rc in self._neighbourhood(r, c):
+            counts[rc] = counts.get(rc, 0) + 1
+
+    def remove_stone(self, r: int, c: int) -> None:
+        counts = self.counts
+        for rc in self._neighbourhood(r, c):
+            k = counts[rc] - 1
+            if k:
+                counts[rc] = k
+            else:
+                del counts[rc]
+
+    def snapshot(self, board: AIBoard) -> List[Tuple[int,int]]:
+        """Empty cells near a stone (same set pruned_moves_for_search would build)."""
+        if not self.counts:
+            ctr = self.n // 2
+            return [(ctr, ctr)]
+        n, cells = board.n, board.cells
+        return list({rc for rc in self.counts if cells[rc[0] * n + rc[1]] == EMPTY})
+
 class CPU:
     """
     Smarter CPU with 3 levels:
@@ -33,29 +131,34 @@ class CPU:
         self.difficulty = difficulty
         self.cpu_piece = piece
         self.opp_piece = "X" if piece == "O" else "O"
+        self._me = PIECE_CODE[self.cpu_piece]
+        self._opp = PIECE_CODE[self.opp_piece]
 
     # ---- public ------------------------------------------------------------
     def choose_move(self, state: GameState) -> Tuple[int, int]:
+        board = AIBoard.from_state(state)
+
         # gather legal empties (exclude blocked)
-        empties = legal_empties(state)
+        empties = legal_empties(board)
         if not empties:
             return (-1, -1)
 
         # if opening, prefer center-ish
-        if board_is_empty(state):
+        if board_is_empty(board):
             n = state.board_size
             return (n // 2, n // 2)
 
         # Tactics first: win in 1, block in 1
-        win_now = self._find_tactical_win(state, self.cpu_piece, empties)
+        win_len = state.win_length
+        win_now = self._find_tactical_win(board, self._me, win_len)
         if win_now:
             return win_now
-        block_now = self._find_tactical_win(state, self.opp_piece, empties)
+        block_now = self._find_tactical_win(board, self._opp, win_len)
         if block_now:
             return block_now
 
         # Candidates: near existing stones to cut branching
-        cands = candidate_moves(state, empties, radius=2)
+        cands = candidate_moves(board, empties, radius=2)
         if not cands:
             cands = empties
 
@@ -65,47 +168,69 @@ class CPU:
         if self.difficulty == "medium":
             # Greedy: pick max eval after hypothetical placement
             best, best_val = None, -math.inf
-            grid = clone_grid(state)
-            blockset = set(state.blocked_expiry.keys())
+            cells, n = board.cells, board.n
             for r, c in cands:
-                grid[r][c] = self.cpu_piece
-                val = evaluate_grid(grid, blockset, self.cpu_piece, state.win_length)
-                grid[r][c] = None
+                cells[r * n + c] = self._me
+                val = evaluate_grid(board, self._me, win_len)
+                cells[r * n + c] = EMPTY
                 if val > best_val:
                     best, best_val = (r, c), val
             return best or random.choice(cands)
 
-        # hard: tiny search with alpha-beta (depth 2)
-        best, _ = self._search_best(state, cands, depth=2, breadth=12)
+        # hard: tiny alpha-beta search, deepened one ply at a time (depth 2)
+        t0 = time.perf_counter()
+        tt = {}  # shared across iterations so each pass reuses the last one's results
+        best = None
+        for depth in range(1, HARD_MAX_DEPTH + 1):
+            best, _ = self._search_best(board, win_len, cands, depth=depth, breadth=12, tt=tt, pv_first=best)
+            if time.perf_counter() - t0 > HARD_TIME_BUDGET:
+                break
         return best or random.choice(cands)
 
     # ---- tactics -----------------------------------------------------------
-    def _find_tactical_win(self, state: GameState, piece: str, empties: List[Tuple[int,int]]) -> Optional[Tuple[int,int]]:
+    def _find_tactical_win(self, board: AIBoard, piece: int, win_len: int) -> Optional[Tuple[int,int]]:
         # One-ply: if placing 'piece' here makes 5 (or win_length), take it.
-        n = state.board_size
-        grid = state.grid
-        for r, c in empties:
-            if winning_if_place(grid, state.blocked_expiry, n, r, c, piece, state.win_length):
-                return (r, c)
-        return None
+        hits = winning_cells(board, piece, win_len)
+        if not hits:
+            return None
+        # lowest set byte = first such cell in row-major order
+        return divmod(((hits & -hits).bit_length() - 1) >> 3, board.n + 1)
 
     # ---- search ------------------------------------------------------------
-    def _search_best(self, state: GameState, cands: List[Tuple[int,int]], depth: int, breadth: int):
+    def _search_best(self, board: AIBoard, win_len: int, cands: List[Tuple[int,int]], depth: int, breadth: int,
+                     tt: Optional[dict] = None, pv_first: Optional[Tuple[int,int]] = None):
         """
         Negamax with alpha-beta, depth-2 default.
-        Breadth limit: order by shallow eval and keep top-K.
+        Breadth limit: order by shallow eval and keep top-K; `pv_first` (if kept) is searched first.
+        Pass the `tt` of a previous, shallower search of the same position to reuse it.
         """
-        grid = clone_grid(state)
-        blocks = set(state.blocked_expiry.keys())
+        board = board.copy()
+        cells, n = board.cells, board.n
+        me, opp = self._me, self._opp
+        h = zobrist_hash(board)
+        near = Candidates.from_board(board, radius=2)
+        if tt is None:
+            tt = {}  # (hash, side to move) -> (depth, value, flag, best move); valid for this position only
+        if not tt:  # new position: drop the previous search's killers/history
+            KILLERS.clear(); HIST.clear()
+        if cells.count(X_CODE) + cells.count(O_CODE) < SYMMETRY_MAX_STONES:
+            cands = unique_by_symmetry(board, cands, me)
         # move ordering
-        ordered = order_moves(grid, blocks, cands, self.cpu_piece, state.win_length)[:breadth]
+        ordered = order_moves(board, cands, me, win_len)[:breadth]
+        if pv_first in ordered:
+            ordered.remove(pv_first)
+            ordered.insert(0, pv_first)
         alpha, beta = -math.inf, math.inf
         best_move, best_val = None, -math.inf
         for (r, c) in ordered:
-            grid[r][c] = self.cpu_piece
-            val = -negamax(grid, blocks, depth-1, alpha=-beta, beta=-alpha,
-                           me=self.opp_piece, opp=self.cpu_piece, win_len=state.win_length)
-            grid[r][c] = None
+            i = r * n + c
+            cells[i] = me
+            near.add_stone(r, c)
+            val = -negamax(board, depth-1, alpha=-beta, beta=-alpha,
+                           me=opp, opp=me, win_len=win_len,
+                           h=h ^ ZOB[me][i], tt=tt, last_move=(r, c), cands=near)
+            near.remove_stone(r, c)
+            cells[i] = EMPTY
             if val > best_val:
                 best_val, best_move = val, (r, c)
             alpha = max(alpha, val)
@@ -117,191 +242,265 @@ class CPU:
 # Helpers: legality, candidates, evaluation, search
 # -----------------------------------------------------------------------------
 
-def legal_empties(state: GameState) -> List[Tuple[int,int]]:
-    blocked = set(state.blocked_expiry.keys())
-    n = state.board_size
-    out = []
-    for r in range(n):
-        for c in range(n):
-            if state.grid[r][c] is None and (r, c) not in blocked:
-                out.append((r, c))
-    return out
-
-def board_is_empty(state: GameState) -> bool:
-    for row in state.grid:
-        for v in row:
-            if v in ("X","O"):
-                return False
-    return True
-
-def candidate_moves(state: GameState, empties: List[Tuple[int,int]], radius: int = 2) -> List[Tuple[int,int]]:
-    n = state.board_size
-    stones = {(r, c) for r in range(n) for c in range(n) if state.grid[r][c] in ("X","O")}
+def legal_empties(board: AIBoard) -> List[Tuple[int,int]]:
+    n, cells = board.n, board.cells
+    return [divmod(i, n) for i, v in enumerate(cells) if v == EMPTY]
+
+def board_is_empty(board: AIBoard) -> bool:
+    return X_CODE not in board.cells and O_CODE not in board.cells
+
+def candidate_moves(board: AIBoard, empties: List[Tuple[int,int]], radius: int = 2) -> List[Tuple[int,int]]:
+    n, cells = board.n, board.cells
+    stones = {(r, c) for r in range(n) for c in range(n) if cells[r * n + c] in (X_CODE, O_CODE)}
     if not stones:
         return []
     cands = set()
     for (sr, sc) in stones:
         for r in range(sr - radius, sr + radius + 1):
             for c in range(sc - radius, sc + radius + 1):
-                if 0 <= r < n and 0 <= c < n and state.grid[r][c] is None and (r, c) not in state.blocked_expiry:
+                if 0 <= r < n and 0 <= c < n and cells[r * n + c] == EMPTY:
                     cands.add((r, c))
     # small heuristic: bias towards center
     ctr = (n - 1) / 2.0
     return sorted(cands, key=lambda rc: abs(rc[0]-ctr)+abs(rc[1]-ctr))
 
-def clone_grid(state: GameState):
-    return [row[:] for row in state.grid]
+# the 8 rotations/reflections of an n x n board as cell gathers, per board size
+SYMMETRY_MAPS = {}
+
+def symmetry_maps(n: int):
+    maps = SYMMETRY_MAPS.get(n)
+    if maps is None:
+        m = n - 1
+        transforms = (lambda r, c: (r, c),     lambda r, c: (c, m - r),
+                      lambda r, c: (m - r, m - c), lambda r, c: (m - c, r),
+                      lambda r, c: (r, m - c), lambda r, c: (m - r, c),
+                      lambda r, c: (c, r),     lambda r, c: (m - c, m - r))
+        maps = SYMMETRY_MAPS[n] = [
+            itemgetter(*[rr * n + cc for rr, cc in (t(r, c) for r in range(n) for c in range(n))])
+            for t in transforms]
+    return maps
+
+def unique_by_symmetry(board: AIBoard, moves, piece) -> List[Tuple[int,int]]:
+    """Keep the first of each group of moves whose resulting positions are rotations/mirrors of each other."""
+    n, cells = board.n, board.cells
+    maps = symmetry_maps(n)
+    seen = set()
+    unique = []
+    for r, c in moves:
+        i = r * n + c
+        cells[i] = piece
+        key = min(bytes(gather(cells)) for gather in maps)
+        cells[i] = EMPTY
+        if key not in seen:
+            seen.add(key)
+            unique.append((r, c))
+    return unique
+
+def zobrist_hash(board: AIBoard) -> int:
+    """Full Zobrist hash of the stones on board (search keeps it incrementally after this)."""
+    h = 0
+    for i, v in enumerate(board.cells):
+        if v == X_CODE or v == O_CODE:
+            h ^= ZOB[v][i]
+    return h
+
+# Bitboards: one byte per cell of a little-endian int, cell (r, c) at byte r*(n+1) + c.
+# The spare zero byte closing each row keeps shifted lines from wrapping onto the next row.
+_FLAG_OF = {code: bytes(1 if v == code else 0 for v in range(256)) for code in (EMPTY, X_CODE, O_CODE)}
+
+def bitboard(board: AIBoard, code: int) -> int:
+    n, flags = board.n, board.cells.translate(_FLAG_OF[code])
+    return int.from_bytes(b"\0".join([flags[r * n:(r + 1) * n] for r in range(n)]), "little")
+
+def _line_steps(n: int):
+    # shift (in bits) to the next cell along: row, column, diag \, diag /
+    return (8, 8 * (n + 1), 8 * (n + 2), 8 * n)
+
+def has_five(stones: int, n: int, win_len: int) -> bool:
+    for step in _line_steps(n):
+        x = stones
+        for j in range(1, win_len):
+            x &= stones >> (j * step)
+        if x:
+            return True
+    return False
 
-def winning_if_place(grid, blocked_expiry, n, r, c, piece, win_len) -> bool:
-    if (r, c) in blocked_expiry or grid[r][c] is not None:
-        return False
-    grid[r][c] = piece
-    won = is_win_from_grid(grid, n, r, c, piece, win_len)
-    grid[r][c] = None
-    return won
+def winning_cells(board: AIBoard, piece, win_len) -> int:
+    """Bitboard of the empty cells where placing `piece` completes win_len in a row."""
+    n = board.n
+    stones = bitboard(board, piece)
+    hits = 0
+    for step in _line_steps(n):
+        # the cell is at position t of a win_len window whose other cells are all stones
+        for t in range(win_len):
+            x = -1
+            for j in range(win_len):
+                if j < t:
+                    x &= stones << ((t - j) * step)
+                elif j > t:
+                    x &= stones >> ((j - t) * step)
+            hits |= x
+    return hits & bitboard(board, EMPTY)
 
 DIRS = [(1,0),(0,1),(1,1),(1,-1)]
 
-def is_win_from_grid(grid, n, r, c, piece, win_len) -> bool:
+def is_win_from_grid(board: AIBoard, r, c, piece, win_len) -> bool:
+    n, cells = board.n, board.cells
     for dr, dc in DIRS:
         cnt = 1
         rr, cc = r+dr, c+dc
-        while 0 <= rr < n and 0 <= cc < n and grid[rr][cc] == piece:
+        while 0 <= rr < n and 0 <= cc < n and cells[rr * n + cc] == piece:
             cnt += 1; rr += dr; cc += dc
         rr, cc = r-dr, c-dc
-        while 0 <= rr < n and 0 <= cc < n and grid[rr][cc] == piece:
+        while 0 <= rr < n and 0 <= cc < n and cells[rr * n + cc] == piece:
             cnt += 1; rr -= dr; cc -= dc
         if cnt >= win_len:
             return True
     return False
 
-def order_moves(grid, blocks, moves, me, win_len) -> List[Tuple[int,int]]:
+def order_moves(board: AIBoard, moves, me, win_len) -> List[Tuple[int,int]]:
     """Simple ordering: immediate wins > blocks > eval score."""
-    n = len(grid)
     wins = []
     blocks_list = []
     rest = []
+    opp = X_CODE if me == O_CODE else O_CODE
+    my_wins = winning_cells(board, me, win_len)
+    opp_wins = winning_cells(board, opp, win_len)
+    n1 = board.n + 1
     # classify
     for r, c in moves:
-        if winning_if_place(grid, blocks, n, r, c, me, win_len):
+        bit = 1 << ((r * n1 + c) << 3)
+        if my_wins & bit:
             wins.append((r, c)); continue
-        opp = "X" if me == "O" else "O"
-        if winning_if_place(grid, blocks, n, r, c, opp, win_len):
+        if opp_wins & bit:
             blocks_list.append((r, c)); continue
         rest.append((r, c))
     # order rest with shallow eval
-    rest_sorted = sorted(rest, key=lambda rc: shallow_move_score(grid, blocks, rc[0], rc[1], me, win_len), reverse=True)
+    rest_sorted = sorted(rest, key=lambda rc: shallow_move_score(board, rc[0], rc[1], me, win_len), reverse=True)
     return wins + blocks_list + rest_sorted
 
-def shallow_move_score(grid, blocks, r, c, me, win_len):
-    grid[r][c] = me
-    val = evaluate_grid(grid, blocks, me, win_len)
-    grid[r][c] = None
-    return val
+# the four lines through each cell as (slice of the flat board, position in it), per board size
+CELL_LINES = {}
 
-# ---- evaluation -------------------------------------------------------------
-
-def evaluate_grid(grid, blocks, me, win_len) -> float:
-    """Pattern-based static eval. Positive is good for 'me'."""
-    opp = "X" if me == "O" else "O"
-    n = len(grid)
-
-    lines: List[List[str]] = []
+def cell_lines(n: int):
+    lines = CELL_LINES.get(n)
+    if lines is not None:
+        return lines
+    lines = []
+    for r in range(n):
+        for c in range(n):
+            row = (slice(r * n, (r + 1) * n), c)
+            col = (slice(c, n * n, n), r)
+            m = min(r, c)                      # diag \ starts at (r-m, c-m)
+            k = min(n - 1 - r, n - 1 - c)
+            dstart = (r - m) * n + (c - m)
+            diag = (slice(dstart, dstart + (m + k) * (n + 1) + 1, n + 1), m)
+            m = min(r, n - 1 - c)              # diag / starts at (r-m, c+m)
+            k = min(n - 1 - r, c)
+            astart = (r - m) * n + (c + m)
+            anti = (slice(astart, astart + (m + k) * (n - 1) + 1, n - 1), m)
+            lines.append((row, col, diag, anti))
+    CELL_LINES[n] = lines
+    return lines
+
+def shallow_move_score(board: AIBoard, r, c, me, win_len):
+    """
+    How much placing `me` at (r, c) changes evaluate_grid. Only the four lines through
+    the cell (and its centrality) change, so ranking by this matches a full re-evaluation.
+    """
+    n, cells = board.n, board.cells
+    opp = X_CODE if me == O_CODE else O_CODE
+    my_gain = 0
+    opp_gain = 0
+    for sl, pos in cell_lines(n)[r * n + c]:
+        before = cells[sl]
+        after = before[:]
+        after[pos] = me
+        my_gain  += score_line(after, me,  win_len) - score_line(before, me,  win_len)
+        opp_gain += score_line(after, opp, win_len) - score_line(before, opp, win_len)
+    return (my_gain - 1.15 * opp_gain) + centrality(n)[r * n + c]
 
-    def push_line(seq: List[str]):
-        if seq:
-            lines.append(seq[:])
+# ---- evaluation -------------------------------------------------------------
 
-    # rows
+# flat indices of every row, column and diagonal, WALL-separated, per board size
+LINE_INDEXERS = {}
+
+def line_indexer(n: int):
+    """Gather for one n: itemgetter over cells + WALL that lays all 6n-2 lines end to end."""
+    getter = LINE_INDEXERS.get(n)
+    if getter is not None:
+        return getter
+    sep = n * n  # index of the WALL byte appended after the cells
+    idx = [sep]
+    def add(line):
+        idx.extend(line); idx.append(sep)
     for r in range(n):
-        cur = []
-        for c in range(n):
-            cur.append(enc_cell(grid, blocks, r, c))
-        push_line(cur)
-    # cols
+        add(range(r * n, (r + 1) * n))
     for c in range(n):
-        cur = []
-        for r in range(n):
-            cur.append(enc_cell(grid, blocks, r, c))
-        push_line(cur)
+        add(range(c, n * n, n))
     # diag /
     for start in range(n):
-        cur = []
-        r, c = start, 0
-        while r >= 0 and c < n:
-            cur.append(enc_cell(grid, blocks, r, c))
-            r -= 1; c += 1
-        push_line(cur)
+        add(r * n + (start - r) for r in range(start, -1, -1))
     for start in range(1, n):
-        cur = []
-        r, c = n-1, start
-        while r >= 0 and c < n:
-            cur.append(enc_cell(grid, blocks, r, c))
-            r -= 1; c += 1
-        push_line(cur)
+        add(r * n + (start + n - 1 - r) for r in range(n - 1, start - 1, -1))
     # diag \
     for start in range(n):
-        cur = []
-        r, c = start, 0
-        while r < n and c < n:
-            cur.append(enc_cell(grid, blocks, r, c))
-            r += 1; c += 1
-        push_line(cur)
+        add((start + k) * n + k for k in range(n - start))
     for start in range(1, n):
-        cur = []
-        r, c = 0, start
-        while r < n and c < n:
-            cur.append(enc_cell(grid, blocks, r, c))
-            r += 1; c += 1
-        push_line(cur)
+        add(k * n + start + k for k in range(n - start))
+    getter = LINE_INDEXERS[n] = itemgetter(*idx)
+    return getter
 
-    my_score = 0
-    opp_score = 0
+_WALL_BYTE = bytes([WALL])
+_STONES = re.compile(b"[\x01\x02]")
+
+# per-cell centrality bonus 0.3 / (1 + manhattan distance to the centre), per board size
+CENTRALITY = {}
+
+def centrality(n: int) -> List[float]:
+    cen = CENTRALITY.get(n)
+    if cen is None:
+        ctr = (n - 1) / 2.0
+        cen = CENTRALITY[n] = [0.3 / (1 + abs(r-ctr) + abs(c-ctr)) for r in range(n) for c in range(n)]
+    return cen
+
+def evaluate_grid(board: AIBoard, me, win_len) -> float:
+    """Pattern-based static eval. Positive is good for 'me'."""
+    opp = X_CODE if me == O_CODE else O_CODE
+    n, cells = board.n, board.cells
+
+    # every line in one buffer; the WALL separators act as the board edges
+    lines = bytes(line_indexer(n)(cells + _WALL_BYTE))
 
     # score patterns in all lines
-    for seq in lines:
-        my_score  += score_line(seq, me,  win_len)
-        opp_score += score_line(seq, opp, win_len)
+    my_score  = score_line(lines, me,  win_len)
+    opp_score = score_line(lines, opp, win_len)
 
-    # centrality bias
-    ctr = (n - 1) / 2.0
+    # centrality bias (stones only, in board order)
+    cen = centrality(n)
     cen_bonus = 0.0
-    for r in range(n):
-        for c in range(n):
-            if grid[r][c] == me:
-                cen_bonus += 0.3 / (1 + abs(r-ctr) + abs(c-ctr))
-            elif grid[r][c] == opp:
-                cen_bonus -= 0.3 / (1 + abs(r-ctr) + abs(c-ctr))
+    for stone in _STONES.finditer(cells):
+        i = stone.start()
+        if cells[i] == me:
+            cen_bonus += cen[i]
+        else:
+            cen_bonus -= cen[i]
 
     # weigh opponent threats slightly higher to encourage blocking
     return (my_score - 1.15 * opp_score) + cen_bonus
 
-def enc_cell(grid, blocks, r, c):
-    if (r, c) in blocks:
-        return SENT_WALL  # wall breaks patterns
-    v = grid[r][c]
-    if v is None:
-        return "."
-    return v
+_RUNS = {X_CODE: re.compile(b"\x01+"), O_CODE: re.compile(b"\x02+")}
 
-def score_line(seq: List[str], piece: str, win_len: int) -> int:
+def score_line(seq, piece: int, win_len: int) -> int:
     s = 0
     n = len(seq)
-    i = 0
-    while i < n:
-        if seq[i] != piece:
-            i += 1
-            continue
-        j = i
-        while j < n and seq[j] == piece:
-            j += 1
+    for run in _RUNS[piece].finditer(seq):
+        i, j = run.span()
         L = j - i
-        left  = seq[i-1] if i-1 >= 0 else SENT_WALL
-        right = seq[j]   if j   < n else SENT_WALL
-        open_ends = (1 if left == "." else 0) + (1 if right == "." else 0)
-
         if L >= win_len:
-            s += WEIGHTS["FIVE"]; i = j; continue
+            s += WEIGHTS["FIVE"]; continue
+        # board edges count as walls
+        open_ends = (1 if i > 0 and seq[i-1] == EMPTY else 0) + (1 if j < n and seq[j] == EMPTY else 0)
         if L == 4:
             s += WEIGHTS["OPEN_FOUR"] if open_ends == 2 else WEIGHTS["CLOSED_FOUR"]
         elif L == 3:
@@ -310,51 +509,111 @@ def score_line(seq: List[str], piece: str, win_len: int) -> int:
             s += WEIGHTS["OPEN_TWO"] if open_ends == 2 else WEIGHTS["CLOSED_TWO"]
         else:
             s += WEIGHTS["ONE"]
-        i = j
     return s
 
 # ---- negamax ---------------------------------------------------------------
 
-def negamax(grid, blocks, depth, alpha, beta, me, opp, win_len) -> float:
-    # terminal: direct five on board?
-    if has_win_anywhere(grid, me, win_len):
-        return  WEIGHTS["FIVE"]
-    if has_win_anywhere(grid, opp, win_len):
+def negamax(board: AIBoard, depth, alpha, beta, me, opp, win_len, h=None, tt=None, last_move=None,
+            cands: Optional[Candidates] = None) -> float:
+    """
+    Fail-soft negamax. Pass the board's Zobrist hash `h` and a dict `tt` to memoize nodes.
+    `last_move` is opp's stone that led here; without it the whole board is scanned for fives.
+    `cands` tracks the stones on board; without it move generation rescans the board.
+    """
+    alpha_orig = alpha
+    tt_move = None
+    if tt is not None:
+        entry = tt.get((h, me))
+        if entry is not None:
+            e_depth, e_val, e_flag, tt_move = entry
+            if e_depth >= depth:
+                if e_flag == TT_EXACT:
+                    return e_val
+                if e_flag == TT_LOWER:
+                    alpha = max(alpha, e_val)
+                else:
+                    beta = min(beta, e_val)
+                if alpha >= beta:
+                    return e_val
+
+    # terminal: direct five on board? (final at any depth)
+    if last_move is not None:
+        # only the stone just placed (by opp) can have completed a line
+        lost = is_win_from_grid(board, last_move[0], last_move[1], opp, win_len)
+    else:
+        if has_win_anywhere(board, me, win_len):
+            if tt is not None:
+                tt[(h, me)] = (math.inf, WEIGHTS["FIVE"], TT_EXACT, None)
+            return  WEIGHTS["FIVE"]
+        lost = has_win_anywhere(board, opp, win_len)
+    if lost:
+        if tt is not None:
+            tt[(h, me)] = (math.inf, -WEIGHTS["FIVE"], TT_EXACT, None)
         return -WEIGHTS["FIVE"]
     if depth == 0:
-        return evaluate_grid(grid, blocks, me, win_len)
+        val = evaluate_grid(board, me, win_len)
+        if tt is not None:
+            tt[(h, me)] = (0, val, TT_EXACT, None)
+        return val
 
-    moves = pruned_moves_for_search(grid, blocks, radius=2)
+    moves = cands.snapshot(board) if cands is not None else pruned_moves_for_search(board, radius=2)
     if not moves:
         return 0.0
 
-    # order by shallow score
-    moves = sorted(moves, key=lambda rc: shallow_move_score(grid, blocks, rc[0], rc[1], me, win_len), reverse=True)
-
+    # keep the 12 best by shallow score, then search the stored best move first,
+    moves = sorted(moves, key=lambda rc: shallow_move_score(board, rc[0], rc[1], me, win_len), reverse=True)
+    moves = moves[:12]  # hard cap at 12 per node
+    # then this depth's killers, then the rest by history (stable, so shallow order breaks ties)
+    front = [tt_move] if tt_move is not None and tt_move in moves else []
+    for km in KILLERS.get(depth, ()):
+        if km in moves and km not in front:
+            front.append(km)
+    rest = [mv for mv in moves if mv not in front]
+    rest.sort(key=lambda rc: HIST.get((rc[0], rc[1], me), 0), reverse=True)
+    moves = front + rest
+
+    cells, n = board.cells, board.n
     best = -math.inf
-    for (r, c) in moves[:12]:  # hard cap at 12 per node
-        grid[r][c] = me
-        val = -negamax(grid, blocks, depth-1, -beta, -alpha, opp, me, win_len)
-        grid[r][c] = None
+    best_move = None
+    for (r, c) in moves:
+        i = r * n + c
+        cells[i] = me
+        if cands is not None:
+            cands.add_stone(r, c)
+        child_h = h ^ ZOB[me][i] if tt is not None else None
+        val = -negamax(board, depth-1, -beta, -alpha, opp, me, win_len, child_h, tt, (r, c), cands)
+        if cands is not None:
+            cands.remove_stone(r, c)
+        cells[i] = EMPTY
         if val > best:
             best = val
+            best_move = (r, c)
         if best > alpha:
             alpha = best
         if alpha >= beta:
+            killers = KILLERS.setdefault(depth, [])
+            if (r, c) not in killers:
+                killers.insert(0, (r, c))
+                del killers[2:]
+            HIST[(r, c, me)] = HIST.get((r, c, me), 0) + depth * depth
             break
+
+    if tt is not None:
+        if best <= alpha_orig:
+            flag = TT_UPPER
+        elif best >= beta:
+            flag = TT_LOWER
+        else:
+            flag = TT_EXACT
+        tt[(h, me)] = (depth, best, flag, best_move)
     return best
 
-def has_win_anywhere(grid, piece, win_len) -> bool:
-    n = len(grid)
-    for r in range(n):
-        for c in range(n):
-            if grid[r][c] == piece and is_win_from_grid(grid, n, r, c, piece, win_len):
-                return True
-    return False
+def has_win_anywhere(board: AIBoard, piece, win_len) -> bool:
+    return has_five(bitboard(board, piece), board.n, win_len)
 
-def pruned_moves_for_search(grid, blocks, radius=2):
-    n = len(grid)
-    stones = {(r,c) for r in range(n) for c in range(n) if grid[r][c] in ("X","O")}
+def pruned_moves_for_search(board: AIBoard, radius=2):
+    n, cells = board.n, board.cells
+    stones = {(r,c) for r in range(n) for c in range(n) if cells[r * n + c] in (X_CODE, O_CODE)}
     if not stones:
         ctr = n//2
         return [(ctr, ctr)]
@@ -362,6 +621,6 @@ def pruned_moves_for_search(grid, blocks, radius=2):
     for (sr, sc) in stones:
         for r in range(sr - radius, sr + radius + 1):
             for c in range(sc - radius, sc + radius + 1):
-                if 0 <= r < n and 0 <= c < n and grid[r][c] is None and (r, c) not in blocks:
+                if 0 <= r < n and 0 <= c < n and cells[r * n + c] == EMPTY:
                     cands.add((r, c))
     return list(cands)
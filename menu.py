@@ -1,12 +1,18 @@
 # src/menu.py
 from __future__ import annotations
 import pygame
+import pygame.gfxdraw
 import os
-from typing import Optional, Callable, List, Tuple
-from dataclasses import dataclass
+import logging
+from typing import Optional, Callable, List, Tuple, Dict
+from dataclasses import dataclass, field
+from collections import namedtuple
 from enum import Enum
+from functools import lru_cache, partial
+from concurrent.futures import Future, ThreadPoolExecutor
 from theme_manager import get_theme_manager, ThemeConfig
 import char_select
+import storage
 
 try:
     from char_select import show_character_select
@@ -14,6 +20,85 @@ except Exception:
     # nếu không thể import (tạm thời) giữ variable bằng None để không crash
     show_character_select = None
 
+log = logging.getLogger(__name__)
+
+# Decoded + display-converted images, keyed by absolute path
+_IMG_CACHE: Dict[str, pygame.Surface] = {}
+# Keys cached before a display mode existed; converted on the next lookup
+_IMG_UNCONVERTED = set()
+
+
+def _cached_load(path: str, alpha: Optional[bool] = None) -> pygame.Surface:
+    """Load an image once and reuse the display-format Surface on later calls.
+
+    alpha=None picks convert_alpha() for images with per-pixel alpha and
+    convert() for opaque ones.
+    """
+    key = os.path.abspath(path)
+    surf = _IMG_CACHE.get(key)
+    if surf is None:
+        surf = pygame.image.load(path)
+        _IMG_UNCONVERTED.add(key)
+    elif key not in _IMG_UNCONVERTED:
+        return surf
+    if pygame.display.get_surface() is None:
+        # convert() needs a display mode; keep the raw surface until one exists
+        _IMG_CACHE[key] = surf
+        return surf
+    if alpha is None:
+        alpha = bool(surf.get_flags() & pygame.SRCALPHA)
+    surf = surf.convert_alpha() if alpha else surf.convert()
+    _IMG_CACHE[key] = surf
+    _IMG_UNCONVERTED.discard(key)
+    return surf
+
+def _adopt_raw_image(path: str, surf: pygame.Surface) -> None:
+    """Seed the cache with a surface decoded elsewhere; _cached_load converts it."""
+    key = os.path.abspath(path)
+    if key not in _IMG_CACHE:
+        _IMG_CACHE[key] = surf
+        _IMG_UNCONVERTED.add(key)
+
+
+@lru_cache(maxsize=32)
+def load_and_convert(path: str, size: Optional[Tuple[int, int]] = None) -> pygame.Surface:
+    """Display-format image, smoothscaled to size if given; built once per (path, size).
+
+    Needs a display mode, so only call it once the window exists.
+    """
+    surf = _cached_load(path)
+    if size is None or surf.get_size() == size:
+        return surf
+    scaled = pygame.transform.smoothscale(surf, size)
+    return scaled.convert_alpha() if scaled.get_flags() & pygame.SRCALPHA else scaled.convert()
+
+
+# Single background worker for decoding images ahead of time (created on first use)
+_PREFETCH_POOL: Optional[ThreadPoolExecutor] = None
+
+
+def _prefetch_pool() -> ThreadPoolExecutor:
+    global _PREFETCH_POOL
+    if _PREFETCH_POOL is None:
+        _PREFETCH_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="menu-prefetch")
+    return _PREFETCH_POOL
+
+# Fonts shared by every menu widget, keyed by (name, size, bold); name None = pygame default font
+_FONT_CACHE: Dict[Tuple[Optional[str], int, bool], pygame.font.Font] = {}
+
+
+def get_font(name: Optional[str], size: int, bold: bool = False) -> pygame.font.Font:
+    """Resolve/open a font once and share it."""
+    key = (name, size, bold)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        if not _FONT_CACHE:
+            # Font objects die with pygame.quit() (the game screens call it); start fresh after
+            pygame.register_quit(_FONT_CACHE.clear)
+        font = pygame.font.SysFont(name, size, bold=bold) if name else pygame.font.Font(None, size)
+        _FONT_CACHE[key] = font
+    return font
+
 # Colors (fallback)
 WHITE = (240, 240, 240)
 BLACK = (30, 30, 30)
@@ -26,6 +111,96 @@ GREEN = (80, 200, 80)
 BLUE = (70, 130, 220)
 PURPLE = (150, 80, 200)
 
+_VALID_DIFF = frozenset(("easy", "medium", "hard"))
+
+
+# Theme background path -> whether the file exists (stat'ed once per path)
+_BG_EXISTS_CACHE: Dict[str, bool] = {}
+
+
+def _is_pickable_theme(t) -> bool:
+    # must explicitly be selectable (fallback True)
+    if not getattr(t, "selectable", True):
+        return False
+    # must have a background image that actually exists
+    bg = getattr(t, "background_image", None)
+    if not isinstance(bg, str):
+        return False
+    exists = _BG_EXISTS_CACHE.get(bg)
+    if exists is None:
+        exists = _BG_EXISTS_CACHE[bg] = os.path.exists(bg)
+    return exists
+
+
+# Theme music path -> whether the file exists
+_MUSIC_EXISTS: Dict[str, bool] = {}
+
+
+def _music_exists(path: str) -> bool:
+    exists = _MUSIC_EXISTS.get(path)
+    if exists is None:
+        exists = _MUSIC_EXISTS[path] = os.path.exists(path)
+    return exists
+
+
+def refresh_theme_cache():
+    """Forget cached background/music existence checks (e.g. after adding theme files)."""
+    _BG_EXISTS_CACHE.clear()
+    _MUSIC_EXISTS.clear()
+
+
+# Immutable per-theme snapshot read by the draw methods every frame
+ThemeView = namedtuple("ThemeView", "name accent_color text_color background_color board_color music selectable")
+
+# Named button colour schemes: (color, hover_color); "accent" follows the theme
+BUTTON_STYLES = {
+    "green": (GREEN, (120, 255, 120)),
+    "blue": (BLUE, (100, 170, 255)),
+    "red": (RED, (255, 100, 100)),
+    "purple": (PURPLE, (200, 120, 255)),
+    "gray": (GRAY, LIGHT_GRAY),
+}
+
+# Column menus: (label, action name, style) laid out top to bottom
+MAIN_SPEC = (
+    ("Play", "goto_mode_select", "accent"),
+    ("Settings", "goto_settings", "accent"),
+    ("Rules", "goto_rules", "accent"),
+    ("How to Play", "goto_how2play", "accent"),
+    ("Credits", "goto_credits", "accent"),
+    ("Exit", "request_exit", "red"),
+)
+MODE_SELECT_SPEC = (
+    ("Player vs Player", "pvp", "green"),
+    ("Player vs CPU", "goto_difficulty", "blue"),
+    ("Back", "goto_main", "gray"),
+)
+BO_SELECT_SPEC = (
+    ("BO1 (Single Game)", "bo1", "green"),
+    ("BO3 (Best of 3)", "bo3", "accent"),
+    ("BO5 (Best of 5)", "bo5", "accent"),
+    ("Back", "back_from_bo", "gray"),
+)
+DIFFICULTY_SPEC = (
+    ("Easy", "easy", "green"),
+    ("Medium", "medium", "accent"),
+    ("Hard", "hard", "red"),
+    ("Back", "goto_mode_select", "gray"),
+)
+SETTINGS_SPEC = (
+    ("Board Size", "goto_board_size", "accent"),
+    ("Time per Move", "goto_time_select", "accent"),
+    ("Theme", "goto_theme_select", "purple"),
+    ("Volume Setting", "goto_volume", "accent"),
+    ("Back", "goto_main", "gray"),
+)
+BOARD_SIZE_SPEC = (
+    ("9 x 9", "size9", "accent"),
+    ("13 x 13", "size13", "accent"),
+    ("15 x 15", "size15", "accent"),
+    ("Back", "goto_main", "gray"),
+)
+
 
 class MenuState(Enum):
     MAIN = "main"
@@ -42,6 +217,37 @@ class MenuState(Enum):
     CREDITS = "credits"
 
 
+# States that change between frames without input (caret blink) and so are
+# repainted every frame regardless of the dirty flag
+_ANIMATED_STATES = frozenset((MenuState.TIME_SELECT,))
+
+# Screens drawn by the generic button branch whose only motion-driven change is
+# button hover (VOLUME_SETTINGS drags its slider, TIME_SELECT blinks its caret)
+_HOVER_ONLY_STATES = frozenset((MenuState.MAIN, MenuState.MODE_SELECT, MenuState.BO_SELECT,
+                                MenuState.SETTINGS, MenuState.DIFFICULTY, MenuState.BOARD_SIZE,
+                                MenuState.THEME_SELECT))
+
+# Mostly static screens get a lower frame cap to save CPU/battery
+_STATIC_FPS = 20
+_STATIC_STATES = frozenset((MenuState.CREDITS, MenuState.RULES))
+
+# Arrow-key paging on the rules screens: min gap between turns and, while an arrow
+# is held, the delay before paging repeats (ms)
+_NAV_REPEAT_DELAY = 300
+_NAV_REPEAT_MS = 120
+
+# The only event types the menu (and the character select it opens) reacts to;
+# everything else is blocked at the SDL queue while the menu runs. TEXTINPUT/TEXTEDITING
+# must pass: pygame 2 fills KEYDOWN.unicode from them, which name entry relies on.
+_MENU_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT, pygame.TEXTEDITING,
+                pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                pygame.MOUSEMOTION, pygame.VIDEORESIZE, pygame.VIDEOEXPOSE,
+                pygame.WINDOWFOCUSLOST, pygame.WINDOWFOCUSGAINED, pygame.WINDOWMINIMIZED, pygame.WINDOWRESTORED]
+
+# Frame cap while the window is unfocused or minimized
+_BACKGROUND_FPS = 10
+
+
 class NumericInput:
     def __init__(self, center_x, y, width, height, default="20",
                  color=(230,230,230), text_color=(0,0,0), placeholder="seconds"):
@@ -49,44 +255,65 @@ class NumericInput:
         self.bg = color
         self.text_color = text_color
         self.placeholder = placeholder
-        self.font = pygame.font.Font(None, 32)
+        self.font = get_font(None, 32)
 
-        self.text = str(default)
+        self._chars = list(str(default))  # edit buffer; joined lazily through .text
+        self._text: Optional[str] = None
+        self._text_surf: Optional[pygame.Surface] = None
+        self._prefix_widths: Optional[List[int]] = None  # [i] = pixel width of text[:i]
         self.active = False
-        self.cursor_i = len(self.text)
+        self.cursor_i = len(self._chars)
         self._blink = 0
 
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = "".join(self._chars)
+        return self._text
+
+    def _edited(self):
+        """Drop everything derived from the buffer after an insert/delete"""
+        self._text = None
+        self._text_surf = None
+        self._prefix_widths = None
+
     def handle_event(self, event):
         """Return True if Enter was pressed (i.e., 'confirm')."""
         if event.type == pygame.MOUSEBUTTONDOWN:
             self.active = self.rect.collidepoint(event.pos)
         elif self.active and event.type == pygame.KEYDOWN:
+            chars = self._chars
             if event.key == pygame.K_RETURN:
                 return True
             elif event.key == pygame.K_BACKSPACE:
                 if self.cursor_i > 0:
-                    self.text = self.text[:self.cursor_i-1] + self.text[self.cursor_i:]
+                    del chars[self.cursor_i - 1]
                     self.cursor_i -= 1
+                    self._edited()
             elif event.key == pygame.K_DELETE:
-                if self.cursor_i < len(self.text):
-                    self.text = self.text[:self.cursor_i] + self.text[self.cursor_i+1:]
+                if self.cursor_i < len(chars):
+                    del chars[self.cursor_i]
+                    self._edited()
             elif event.key == pygame.K_LEFT:
                 self.cursor_i = max(0, self.cursor_i - 1)
             elif event.key == pygame.K_RIGHT:
-                self.cursor_i = min(len(self.text), self.cursor_i + 1)
+                self.cursor_i = min(len(chars), self.cursor_i + 1)
             else:
                 if event.unicode.isdigit():
-                    self.text = self.text[:self.cursor_i] + event.unicode + self.text[self.cursor_i:]
+                    chars.insert(self.cursor_i, event.unicode)
                     self.cursor_i += 1
+                    self._edited()
         return False
 
     def draw(self, surface):
         pygame.draw.rect(surface, self.bg, self.rect, border_radius=8)
         pygame.draw.rect(surface, (80,80,80), self.rect, width=2, border_radius=8)
 
-        display = self.text if self.text else self.placeholder
-        color = self.text_color if self.text else (120,120,120)
-        surf = self.font.render(display, True, color)
+        surf = self._text_surf
+        if surf is None:
+            display = self.text if self._chars else self.placeholder
+            color = self.text_color if self._chars else (120,120,120)
+            surf = self._text_surf = self.font.render(display, True, color)
         text_x = self.rect.x + 10
         text_y = self.rect.y + (self.rect.height - surf.get_height()) // 2
         surface.blit(surf, (text_x, text_y))
@@ -95,7 +322,11 @@ class NumericInput:
         if self.active:
             self._blink = (self._blink + 1) % 60
             if self._blink < 30:
-                cx = text_x + self.font.size(self.text[:self.cursor_i])[0]
+                if self._prefix_widths is None:
+                    # Measured once per edit; caret moves are then a table lookup
+                    text = self.text
+                    self._prefix_widths = [self.font.size(text[:i])[0] for i in range(len(text) + 1)]
+                cx = text_x + self._prefix_widths[self.cursor_i]
                 pygame.draw.line(surface, self.text_color, (cx, text_y), (cx, text_y + surf.get_height()), 1)
 
 
@@ -117,21 +348,23 @@ class VolumeSlider:
         self.color = color
         self.track_color = track_color
         self.accent_color = accent_color
-        self.font = pygame.font.Font(None, 24)
+        self.font = get_font(None, 24)
         self.slider_width = 20
         self.slider_height = 24
+        # Reused every frame; only their x/width move with the volume
+        self._handle_rect = pygame.Rect(0, self.rect.centery - self.slider_height // 2,
+                                        self.slider_width, self.slider_height)
+        self._filled_rect = self.track_rect.copy()
+        self._label_surf = self.font.render("Volume", True, (255, 255, 255))
+        self._last_volume: Optional[float] = None
+        self._volume_text_surf: Optional[pygame.Surface] = None
 
     def handle_event(self, event):
         """Handle mouse events for dragging the slider"""
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             mouse_pos = event.pos
-            slider_pos = self._get_slider_pos()
-            slider_rect = pygame.Rect(
-                slider_pos - self.slider_width // 2,
-                self.rect.centery - self.slider_height // 2,
-                self.slider_width,
-                self.slider_height
-            )
+            slider_rect = self._handle_rect
+            slider_rect.x = self._get_slider_pos() - self.slider_width // 2
             if slider_rect.collidepoint(mouse_pos) or self.track_rect.collidepoint(mouse_pos):
                 self.dragging = True
                 self._update_volume_from_pos(mouse_pos[0])
@@ -178,10 +411,8 @@ class VolumeSlider:
     def draw(self, surface, theme):
         """Draw the volume slider"""
         # Draw label
-        label_text = "Volume"
-        label_surf = self.font.render(label_text, True, (255, 255, 255))
         label_y = self.rect.y - 30
-        surface.blit(label_surf, (self.rect.x, label_y))
+        surface.blit(self._label_surf, (self.rect.x, label_y))
 
         # Draw track background
         pygame.draw.rect(surface, self.track_color, self.track_rect, border_radius=4)
@@ -189,24 +420,21 @@ class VolumeSlider:
         # Draw filled portion
         filled_width = int(self.volume * self.track_rect.width)
         if filled_width > 0:
-            filled_rect = pygame.Rect(self.track_rect.left, self.track_rect.top, filled_width, self.track_rect.height)
+            filled_rect = self._filled_rect
+            filled_rect.width = filled_width
             pygame.draw.rect(surface, self.accent_color, filled_rect, border_radius=4)
 
         # Draw slider handle
-        slider_x = self._get_slider_pos()
-        slider_y = self.rect.centery
-        slider_rect = pygame.Rect(
-            slider_x - self.slider_width // 2,
-            slider_y - self.slider_height // 2,
-            self.slider_width,
-            self.slider_height
-        )
+        slider_rect = self._handle_rect
+        slider_rect.x = self._get_slider_pos() - self.slider_width // 2
         pygame.draw.rect(surface, self.accent_color, slider_rect, border_radius=6)
         pygame.draw.rect(surface, (255, 255, 255), slider_rect, width=2, border_radius=6)
 
-        # Draw volume percentage
-        volume_text = f"{int(self.volume * 100)}%"
-        volume_surf = self.font.render(volume_text, True, (255, 255, 255))
+        # Draw volume percentage (re-rendered only when the level changed)
+        if self.volume != self._last_volume:
+            self._last_volume = self.volume
+            self._volume_text_surf = self.font.render(f"{int(self.volume * 100)}%", True, (255, 255, 255))
+        volume_surf = self._volume_text_surf
         volume_x = self.rect.right - volume_surf.get_width() - 10
         surface.blit(volume_surf, (volume_x, label_y))
 
@@ -224,6 +452,26 @@ class Button:
     text_color: Tuple[int, int, int] = BLACK
     enabled: bool = True
     darken_on_hover: bool = True
+    # Rendered labels + centred rects, keyed by (font, enabled, text colour, text)
+    _labels: Dict[tuple, Tuple[pygame.Surface, pygame.Rect]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    _body_rect: Optional[Tuple[int, int, int, int]] = field(default=None, init=False, repr=False, compare=False)
+    _shadow_rect: Optional[Tuple[int, int, int, int]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        shadow_offset = 4
+        self._body_rect = (self.x, self.y, self.width, self.height)
+        self._shadow_rect = (self.x + shadow_offset, self.y + shadow_offset, self.width, self.height)
+
+    def _label(self, font: pygame.font.Font) -> Tuple[pygame.Surface, pygame.Rect]:
+        """Rendered text + rect for the current state; rendered once per variant"""
+        key = (id(font), self.enabled, self.text_color, self.text)
+        label = self._labels.get(key)
+        if label is None:
+            text_surf = font.render(self.text, True, self.text_color if self.enabled else LIGHT_GRAY)
+            text_rect = text_surf.get_rect(center=(self.x + self.width // 2, self.y + self.height // 2))
+            label = self._labels[key] = (text_surf, text_rect)
+        return label
 
     def is_hovered(self, mouse_pos: Tuple[int, int]) -> bool:
         mx, my = mouse_pos
@@ -244,17 +492,12 @@ class Button:
             color = self.color
 
         # Button background with shadow effect
-        shadow_offset = 4
-        pygame.draw.rect(screen, (50, 50, 50),
-                         (self.x + shadow_offset, self.y + shadow_offset, self.width, self.height),
-                         border_radius=8)
-        pygame.draw.rect(screen, color, (self.x, self.y, self.width, self.height), border_radius=8)
-        pygame.draw.rect(screen, BLACK, (self.x, self.y, self.width, self.height), 2, border_radius=8)
+        pygame.draw.rect(screen, (50, 50, 50), self._shadow_rect, border_radius=8)
+        pygame.draw.rect(screen, color, self._body_rect, border_radius=8)
+        pygame.draw.rect(screen, BLACK, self._body_rect, 2, border_radius=8)
 
         # Button text
-        text_surf = font.render(self.text, True, self.text_color if self.enabled else LIGHT_GRAY)
-        text_rect = text_surf.get_rect(center=(self.x + self.width // 2, self.y + self.height // 2))
-        screen.blit(text_surf, text_rect)
+        screen.blit(*self._label(font))
 
 class RulesScreen:
     """
@@ -268,9 +511,9 @@ class RulesScreen:
         self.screen = getattr(owner, "screen", None)
         self.W = getattr(owner, "W", 1280)
         self.H = getattr(owner, "H", 720)
-        self.font = getattr(owner, "font_normal", pygame.font.SysFont("consolas", 20))
-        self.font_small = getattr(owner, "font_small", pygame.font.SysFont("consolas", 16))
-        self.font_big = getattr(owner, "font_big", pygame.font.SysFont("consolas", 28, bold=True))
+        self.font = getattr(owner, "font_normal", None) or get_font("consolas", 20)
+        self.font_small = getattr(owner, "font_small", None) or get_font("consolas", 16)
+        self.font_big = getattr(owner, "font_big", None) or get_font("consolas", 28, bold=True)
         # Ensure assets_dir is an absolute path
         self.assets_dir = os.path.abspath(assets_dir)
 
@@ -278,46 +521,94 @@ class RulesScreen:
         self.pages = [ {"image": None, "text": []} for _ in range(self.num_pages) ]
         self.current = 0
 
-        # Try to load images named 1.png, 2.png, ... N.png (or page1.png, page2.png, ... pageN.png as fallback)
+        # Find images named 1.png, 2.png, ... N.png (or page1.png, page2.png, ... pageN.png as fallback).
+        # They are only decoded when a page is first shown (see _load_page).
+        try:
+            existing = set(os.listdir(self.assets_dir))  # one directory read instead of a stat per name
+        except OSError:
+            existing = set()
         for i in range(self.num_pages):
             # First try: 1.png, 2.png, 3.png (matching actual files)
-            p = os.path.join(self.assets_dir, f"{i+1}.png")
             # Fallback: page1.png, page2.png, page3.png (for backward compatibility)
-            if not os.path.exists(p):
-                p = os.path.join(self.assets_dir, f"page{i+1}.png")
-            print("Checking:", p, os.path.exists(p))
-
-            if os.path.exists(p):
-                try:
-                    img = pygame.image.load(p).convert_alpha()
-                    self.pages[i]["image"] = img
-                except Exception:
-                    self.pages[i]["image"] = None
+            # None -> will use placeholder
+            for name in (f"{i+1}.png", f"page{i+1}.png"):
+                if name in existing:
+                    self.pages[i]["path"] = os.path.join(self.assets_dir, name)
+                    break
             else:
-                self.pages[i]["image"] = None  # will use placeholder
-
-        self._last_mouse_pressed = False
+                self.pages[i]["path"] = None
+        self._prefetch: Dict[int, Future] = {}
+        self._last_nav_ms = -_NAV_REPEAT_MS  # get_ticks() of the last arrow-key page turn
+        self._held_nav: Optional[int] = None  # arrow key held down (KEYDOWN seen, no KEYUP yet)
+        self._next_nav_ms = 0  # get_ticks() when the held arrow turns the next page
+        self._prefetched_for: Optional[int] = None
+
+        self._layout_size: Optional[Tuple[int, int]] = None
         self._back_rect = None
         self._left_btn_rect = None
         self._right_btn_rect = None
         self._page_indicator_positions = []
+        self._hit_regions = []
+        self._indicator_active_surf = None
+        self._indicator_inactive_surf = None
+        self._indicator_accent = None
+        self._scaled_cache: Dict[int, tuple] = {}  # page -> (layout/image key, surface, rect, shadow, shadow rect)
+        self._panel_surf: Optional[pygame.Surface] = None
+        self._text_cache: Dict[int, tuple] = {}  # page -> (layout key, [(surface, pos), ...])
+        self._back_label = self.font_big.render("Back", True, (255, 255, 255))  # white text
+        self._placeholder_labels: Dict[tuple, pygame.Surface] = {}  # (page, text colour) -> "Page N"
+        # Indicator numbers: (active white, inactive light gray) per page
+        self._indicator_glyphs = [(self.font_small.render(str(i+1), True, (255, 255, 255)),
+                                   self.font_small.render(str(i+1), True, (180, 180, 180)))
+                                  for i in range(self.num_pages)]
 
     def set_page_text(self, idx: int, lines: list):
         if 0 <= idx < self.num_pages:
             self.pages[idx]["text"] = list(lines)
+            self._text_cache.pop(idx, None)
 
     def set_page_image(self, idx: int, path: str):
         if 0 <= idx < self.num_pages and os.path.exists(path):
             try:
-                img = pygame.image.load(path).convert_alpha()
+                img = _cached_load(path)
                 self.pages[idx]["image"] = img
+                self.pages[idx]["path"] = path
+                self.pages[idx]["source"] = path
             except Exception:
                 pass
 
+    def _load_page(self, idx: int) -> Optional[pygame.Surface]:
+        """Page image, decoded on first use (from the prefetch thread when it got there first)"""
+        page = self.pages[idx]
+        if page["image"] is None and page.get("path"):
+            path = page.pop("path")
+            future = self._prefetch.pop(idx, None)
+            try:
+                if future is not None:
+                    _adopt_raw_image(path, future.result())
+                page["image"] = _cached_load(path)  # display conversion stays on this thread
+                page["source"] = path  # lets the scaled copy come from the shared cache
+            except Exception:
+                page["image"] = None
+        return page["image"]
+
+    def _prefetch_neighbours(self):
+        """Decode the previous/next page images in the background"""
+        if self._prefetched_for == self.current:
+            return
+        self._prefetched_for = self.current
+        for idx in ((self.current - 1) % self.num_pages, (self.current + 1) % self.num_pages):
+            path = self.pages[idx].get("path")
+            if path and self.pages[idx]["image"] is None and idx not in self._prefetch:
+                self._prefetch[idx] = _prefetch_pool().submit(pygame.image.load, path)
+
     def layout(self):
         self.screen = getattr(self.owner, "screen", self.screen)
         if self.screen:
             self.W, self.H = self.screen.get_size()
+        if self._layout_size == (self.W, self.H):
+            return  # rects (and the points/shadows derived from them) are still valid
+        self._layout_size = (self.W, self.H)
 
         gap = 30
         # Reduced layout: smaller text and image areas
@@ -355,9 +646,13 @@ class RulesScreen:
         indicator_gap = 18
         indicator_total_w = self.num_pages * 28 + (self.num_pages - 1) * indicator_gap
         start_ind_x = self.panel_center_x - indicator_total_w // 2
+        # Equal spacing lets _handle_click find the indicator arithmetically
+        self._ind_start_x = start_ind_x
+        self._ind_pitch = 28 + indicator_gap
+        self._ind_y0 = indicators_y
         self._page_indicator_positions = []
         for i in range(self.num_pages):
-            x = start_ind_x + i * (28 + indicator_gap)
+            x = start_ind_x + i * self._ind_pitch
             r = pygame.Rect(x, indicators_y, 28, 28)
             self._page_indicator_positions.append(r)
 
@@ -370,16 +665,152 @@ class RulesScreen:
         self._left_btn_rect = pygame.Rect(nav_start_x, nav_y, btn_size, btn_size)
         self._right_btn_rect = pygame.Rect(nav_start_x + btn_size + nav_gap, nav_y, btn_size, btn_size)
 
+        # Arrow triangles for the nav buttons
+        s = btn_size // 3
+        cx, cy = self._left_btn_rect.center
+        self._left_arrow_points = [(cx + s//2, cy - s), (cx + s//2, cy + s), (cx - s, cy)]
+        cx, cy = self._right_btn_rect.center
+        self._right_arrow_points = [(cx - s//2, cy - s), (cx - s//2, cy + s), (cx + s, cy)]
+
         # Back button: centered relative to panel, below navigation arrows
         back_w, back_h = 280, 52
         back_x = self.panel_center_x - back_w // 2
         back_y = nav_y + btn_size + 20  # Below navigation arrows
         self._back_rect = pygame.Rect(back_x, back_y, back_w, back_h)
 
-    def _draw_button(self, rect: pygame.Rect, label: str = "", hover=False, arrow=None):
-        theme = self.owner._get_current_theme()
-        accent_color = getattr(theme, "accent_color", ACCENT)
-        
+        # Drop shadows, offset once here rather than per frame
+        self._left_btn_shadow = self._left_btn_rect.move(3, 3)
+        self._right_btn_shadow = self._right_btn_rect.move(3, 3)
+        self._back_shadow_rect = self._back_rect.move(3, 3)
+        self._image_shadow_rect = self.image_rect.move(6, 6)
+
+        # Click targets in priority order; the first rect that contains the click wins
+        self._hit_regions = [
+            (self._left_btn_rect, self._prev_page),
+            (self._right_btn_rect, self._next_page),
+            (self._back_rect, self._go_back),
+        ]
+
+    @staticmethod
+    def _make_indicator_surf(color, size: int = 28) -> pygame.Surface:
+        surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        c = size // 2
+        pygame.gfxdraw.filled_circle(surf, c, c, c - 1, color)
+        pygame.gfxdraw.aacircle(surf, c, c, c - 1, color)
+        return surf.convert_alpha()
+
+    def _ensure_indicator_surfs(self, accent_color):
+        """Pre-render the active/inactive page indicator circles (active one follows the theme accent)."""
+        if self._indicator_inactive_surf is None:
+            self._indicator_inactive_surf = self._make_indicator_surf((100, 100, 100))
+        if self._indicator_active_surf is None or self._indicator_accent != accent_color:
+            self._indicator_active_surf = self._make_indicator_surf(accent_color)
+            self._indicator_accent = accent_color
+
+    def _prev_page(self):
+        self.current = (self.current - 1) % self.num_pages
+
+    def _next_page(self):
+        self.current = (self.current + 1) % self.num_pages
+
+    def _goto_page(self, idx: int):
+        self.current = idx
+
+    def _go_back(self):
+        # go back to main menu
+        try:
+            self.owner._change_state(MenuState.MAIN)
+        except Exception:
+            # fallback: try any back method
+            if hasattr(self.owner, "back_to_menu"):
+                self.owner.back_to_menu()
+
+    def _handle_click(self, mpos):
+        for rect, action in self._hit_regions:
+            if rect.collidepoint(mpos):
+                action()
+                return
+        # Page indicators: 28px squares every _ind_pitch px
+        dx = mpos[0] - self._ind_start_x
+        i = dx // self._ind_pitch
+        if 0 <= i < self.num_pages and dx - i * self._ind_pitch < 28 and 0 <= mpos[1] - self._ind_y0 < 28:
+            self._goto_page(i)
+
+    def _page_text_blits(self, idx: int) -> list:
+        """Rendered heading + wrapped lines for a page, built once per page and layout"""
+        key = (self.text_rect.topleft, self.text_rect.size)
+        cached = self._text_cache.get(idx)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        blits = []
+        heading = self.font_big.render(f"Rule — Page {idx+1}", True, (240, 240, 240))
+        heading_y = self.text_rect.y + 10
+        blits.append((heading, (self.text_rect.x + 10, heading_y)))
+
+        # Text content with word wrapping and padding
+        text_lines = self.pages[idx].get("text", [])
+        if not text_lines:
+            # Show placeholder if no text
+            placeholder = self.font_small.render("No text content available for this page.", True, (200, 200, 200))
+            blits.append((placeholder, (self.text_rect.x + 10, heading_y + 50)))
+
+        y = heading_y + 50
+        line_h = 26
+        text_x = self.text_rect.x + 15
+        max_width = self.text_rect.width - 30
+
+        for line in text_lines:
+            # Word wrap if line is too long
+            words = line.split(' ')
+            current_line = ""
+            for word in words:
+                test_line = current_line + (" " if current_line else "") + word
+                if self.font.size(test_line)[0] <= max_width:
+                    current_line = test_line
+                else:
+                    if current_line:
+                        blits.append((self.font.render(current_line, True, (240, 240, 240)), (text_x, y)))
+                        y += line_h
+                    current_line = word
+
+            # Draw remaining line
+            if current_line:
+                blits.append((self.font.render(current_line, True, (240, 240, 240)), (text_x, y)))
+                y += line_h
+
+            # Stop if text goes beyond text area
+            if y > self.text_rect.bottom - 20:
+                break
+
+        self._text_cache[idx] = (key, blits)
+        return blits
+
+    def _scaled_page_image(self, idx: int) -> tuple:
+        """(image, rect, shadow, shadow rect) fitted to image_rect; built once per page and layout"""
+        page = self.pages[idx]
+        img = page["image"]
+        key = (self.image_rect.topleft, self.image_rect.size, id(img))
+        cached = self._scaled_cache.get(idx)
+        if cached is None or cached[0] != key:
+            iw, ih = img.get_size()
+            # Calculate scale to fit within image_rect while maintaining aspect ratio
+            scale = min(self.image_rect.w / iw, self.image_rect.h / ih)
+            # Don't scale up, only scale down if needed
+            scale = min(scale, 1.0)
+            new_size = (max(1, int(iw*scale)), max(1, int(ih*scale)))
+            source = page.get("source")
+            img_s = load_and_convert(source, new_size) if source else pygame.transform.smoothscale(img, new_size)
+            # Center image within image_rect
+            img_r = img_s.get_rect(center=self.image_rect.center)
+            shadow = pygame.Surface((img_r.width, img_r.height), pygame.SRCALPHA)
+            shadow.fill((0, 0, 0, 80))
+            shadow = shadow.convert_alpha()
+            cached = self._scaled_cache[idx] = (key, img_s, img_r, shadow, img_r.move(5, 5))
+        return cached[1:]
+
+    def _draw_button(self, rect: pygame.Rect, shadow_rect: pygame.Rect, accent_color,
+                     label: str = "", hover=False, arrow_points=None):
         # Use accent color for buttons, darker when hovered
         if hover:
             # Darken the accent color when hovered
@@ -387,189 +818,144 @@ class RulesScreen:
         else:
             bg = accent_color
         
-        pygame.draw.rect(self.screen, (20, 20, 20), rect.move(3,3), border_radius=8)  # shadow
+        pygame.draw.rect(self.screen, (20, 20, 20), shadow_rect, border_radius=8)  # shadow
         pygame.draw.rect(self.screen, bg, rect, border_radius=8)
         pygame.draw.rect(self.screen, (255, 255, 255), rect, 2, border_radius=8)  # white border
 
-        if arrow in ("left","right"):
-            cx, cy = rect.center
-            s = rect.w // 3
-            if arrow == "left":
-                points = [(cx + s//2, cy - s), (cx + s//2, cy + s), (cx - s, cy)]
-            else:
-                points = [(cx - s//2, cy - s), (cx - s//2, cy + s), (cx + s, cy)]
+        if arrow_points:
             # Use white/light color for arrow on dark background
-            pygame.draw.polygon(self.screen, (255, 255, 255), points)
+            pygame.draw.polygon(self.screen, (255, 255, 255), arrow_points)
         else:
             # Use white/light color for text on dark background
             lab_s = self.font.render(label, True, (255, 255, 255))
             self.screen.blit(lab_s, lab_s.get_rect(center=rect.center))
 
-    def _draw_image_placeholder(self, rect: pygame.Rect, page_index: int):
-        theme = self.owner._get_current_theme()
-        pygame.draw.rect(self.screen, (50,50,50), rect.move(6,6), border_radius=10)  # shadow
+    def _draw_image_placeholder(self, rect: pygame.Rect, page_index: int, accent_color, text_color):
+        pygame.draw.rect(self.screen, (50,50,50), self._image_shadow_rect, border_radius=10)  # shadow
         pygame.draw.rect(self.screen, (240,240,240), rect, border_radius=10)
-        pygame.draw.rect(self.screen, getattr(theme, "accent_color", ACCENT), rect, width=3, border_radius=10)
-        txt = self.font_big.render(f"Page {page_index+1}", True, getattr(theme, "text_color", BLACK))
+        pygame.draw.rect(self.screen, accent_color, rect, width=3, border_radius=10)
+        txt = self._placeholder_labels.get((page_index, text_color))
+        if txt is None:
+            txt = self.font_big.render(f"Page {page_index+1}", True, text_color)
+            self._placeholder_labels[(page_index, text_color)] = txt
         self.screen.blit(txt, txt.get_rect(center=rect.center))
 
-    def update_and_draw(self):
+    @property
+    def nav_held(self) -> bool:
+        return self._held_nav is not None
+
+    def release_nav(self):
+        """Forget a held arrow whose KEYUP this screen will not see (state change, focus loss)"""
+        self._held_nav = None
+
+    def _turn_page(self, key: int, now: int):
+        self._last_nav_ms = now
+        if key == pygame.K_LEFT:
+            self._prev_page()
+        else:
+            self._next_page()
+
+    def update_and_draw(self, events=(), mouse_pos: Optional[Tuple[int, int]] = None):
+        """Apply this frame's clicks/arrow keys, then draw the current page.
+
+        events is the list the owner already pulled from the queue this frame;
+        the screen never polls mouse or keyboard state itself.
+        """
         if not self.screen:
             return
 
         self.layout()
+        for event in events:
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                self._handle_click(event.pos)
+            elif event.type == pygame.KEYDOWN and event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+                # One turn per press, at most one per _NAV_REPEAT_MS
+                now = pygame.time.get_ticks()
+                self._held_nav = event.key
+                self._next_nav_ms = now + _NAV_REPEAT_DELAY
+                if now - self._last_nav_ms >= _NAV_REPEAT_MS:
+                    self._turn_page(event.key, now)
+            elif event.type == pygame.KEYUP and event.key == self._held_nav:
+                self._held_nav = None
+        # A held arrow keeps paging after _NAV_REPEAT_DELAY, once per _NAV_REPEAT_MS
+        if self._held_nav is not None:
+            now = pygame.time.get_ticks()
+            if now >= self._next_nav_ms:
+                self._turn_page(self._held_nav, now)
+                self._next_nav_ms = now + _NAV_REPEAT_MS
+
         theme = self.owner._get_current_theme()
+        accent_color = getattr(theme, "accent_color", ACCENT)
+        text_color = getattr(theme, "text_color", BLACK)
 
         # Draw panel using stored dimensions (centered on screen)
         # Use dark background with slight transparency for better contrast
-        panel = pygame.Surface((self.panel_w, self.panel_h), pygame.SRCALPHA)
-        panel.fill((30, 30, 35, 220))  # Dark gray-black with transparency
-        self.screen.blit(panel, (self.panel_x, self.panel_y))
+        if self._panel_surf is None or self._panel_surf.get_size() != (self.panel_w, self.panel_h):
+            self._panel_surf = pygame.Surface((self.panel_w, self.panel_h), pygame.SRCALPHA)
+            self._panel_surf.fill((30, 30, 35, 220))  # Dark gray-black with transparency
+            self._panel_surf = self._panel_surf.convert_alpha()
+        self.screen.blit(self._panel_surf, (self.panel_x, self.panel_y))
+
+        if self._load_page(self.current):
+            img_s, img_r, shadow, shadow_rect = self._scaled_page_image(self.current)
 
-        page = self.pages[self.current]
-        if page.get("image"):
-            img = page["image"]
-            iw, ih = img.get_size()
-            # Calculate scale to fit within image_rect while maintaining aspect ratio
-            scale = min(self.image_rect.w / iw, self.image_rect.h / ih)
-            # Don't scale up, only scale down if needed
-            scale = min(scale, 1.0)
-            new_size = (max(1, int(iw*scale)), max(1, int(ih*scale)))
-            img_s = pygame.transform.smoothscale(img, new_size)
-            # Center image within image_rect
-            img_r = img_s.get_rect(center=self.image_rect.center)
-            
             # Draw shadow for image
-            shadow_rect = img_r.move(5, 5)
-            shadow = pygame.Surface((img_r.width, img_r.height), pygame.SRCALPHA)
-            shadow.fill((0, 0, 0, 80))
             self.screen.blit(shadow, shadow_rect)
             
             # Draw image with border - ensure it's centered in image_rect
             self.screen.blit(img_s, img_r)
-            pygame.draw.rect(self.screen, getattr(theme, "accent_color", ACCENT), img_r, width=2, border_radius=8)
+            pygame.draw.rect(self.screen, accent_color, img_r, width=2, border_radius=8)
         else:
-            self._draw_image_placeholder(self.image_rect, self.current)
+            self._draw_image_placeholder(self.image_rect, self.current, accent_color, text_color)
 
-        # Heading
-        heading = self.font_big.render(f"Rule — Page {self.current+1}", True, (240, 240, 240))
-        heading_y = self.text_rect.y + 10
-        self.screen.blit(heading, (self.text_rect.x + 10, heading_y))
-        
-        # Text content with word wrapping and padding
-        text_lines = self.pages[self.current].get("text", [])
-        if not text_lines:
-            # Show placeholder if no text
-            placeholder = self.font_small.render("No text content available for this page.", True, (200, 200, 200))
-            self.screen.blit(placeholder, (self.text_rect.x + 10, heading_y + 50))
-        
-        y = heading_y + 50
-        line_h = 26
-        text_x = self.text_rect.x + 15
-        max_width = self.text_rect.width - 30
-        
-        for line in text_lines:
-            # Word wrap if line is too long
-            words = line.split(' ')
-            current_line = ""
-            for word in words:
-                test_line = current_line + (" " if current_line else "") + word
-                test_surf = self.font.render(test_line, True, (240, 240, 240))
-                if test_surf.get_width() <= max_width:
-                    current_line = test_line
-                else:
-                    if current_line:
-                        txt_surf = self.font.render(current_line, True, (240, 240, 240))
-                        self.screen.blit(txt_surf, (text_x, y))
-                        y += line_h
-                    current_line = word
-            
-            # Draw remaining line
-            if current_line:
-                txt_surf = self.font.render(current_line, True, (240, 240, 240))
-                self.screen.blit(txt_surf, (text_x, y))
-                y += line_h
-            
-            # Stop if text goes beyond text area
-            if y > self.text_rect.bottom - 20:
-                break
+        # Heading + word-wrapped text content
+        self.screen.blits(self._page_text_blits(self.current), doreturn=False)
 
-        mouse = pygame.mouse.get_pos()
+        mouse = mouse_pos if mouse_pos is not None else pygame.mouse.get_pos()
         
         # Draw page indicators first (top)
+        self._ensure_indicator_surfs(accent_color)
         for i, r in enumerate(self._page_indicator_positions):
             active = (i == self.current)
             if active:
-                col = getattr(theme, "accent_color", ACCENT)
-                num_col = (255, 255, 255)  # white text for active indicator
+                circle = self._indicator_active_surf
             else:
-                col = (100, 100, 100)  # dark gray for inactive
-                num_col = (180, 180, 180)  # light gray text for inactive
-            pygame.draw.circle(self.screen, col, r.center, r.w//2)
-            n_s = self.font_small.render(str(i+1), True, num_col)
+                circle = self._indicator_inactive_surf  # dark gray for inactive
+            self.screen.blit(circle, r.topleft)
+            n_s = self._indicator_glyphs[i][0 if active else 1]
             self.screen.blit(n_s, n_s.get_rect(center=r.center))
 
         # Draw navigation arrows (middle, between indicators and back button)
         left_hover = self._left_btn_rect.collidepoint(mouse)
         right_hover = self._right_btn_rect.collidepoint(mouse)
-        self._draw_button(self._left_btn_rect, arrow="left", hover=left_hover)
-        self._draw_button(self._right_btn_rect, arrow="right", hover=right_hover)
+        self._draw_button(self._left_btn_rect, self._left_btn_shadow, accent_color,
+                          arrow_points=self._left_arrow_points, hover=left_hover)
+        self._draw_button(self._right_btn_rect, self._right_btn_shadow, accent_color,
+                          arrow_points=self._right_arrow_points, hover=right_hover)
 
         # Draw back button (bottom)
         back_hover = self._back_rect.collidepoint(mouse)
-        accent_color = getattr(theme, "accent_color", ACCENT)
-        
+
         # Use accent color for Back button, darker when hovered
         if back_hover:
             back_bg = tuple(max(0, int(c * 0.7)) for c in accent_color)
         else:
             back_bg = accent_color
         
-        pygame.draw.rect(self.screen, (20, 20, 20), self._back_rect.move(3,3), border_radius=10)  # shadow
+        pygame.draw.rect(self.screen, (20, 20, 20), self._back_shadow_rect, border_radius=10)  # shadow
         pygame.draw.rect(self.screen, back_bg, self._back_rect, border_radius=10)
         pygame.draw.rect(self.screen, (255, 255, 255), self._back_rect, width=2, border_radius=10)  # white border
-        lab = self.font_big.render("Back", True, (255, 255, 255))  # white text
+        lab = self._back_label
         self.screen.blit(lab, lab.get_rect(center=self._back_rect.center))
 
-        mouse_pressed = pygame.mouse.get_pressed()[0]
-        clicked = mouse_pressed and not self._last_mouse_pressed
-        if clicked:
-            mpos = pygame.mouse.get_pos()
-            if self._left_btn_rect.collidepoint(mpos):
-                self.current = (self.current - 1) % self.num_pages
-            elif self._right_btn_rect.collidepoint(mpos):
-                self.current = (self.current + 1) % self.num_pages
-            else:
-                for i, r in enumerate(self._page_indicator_positions):
-                    if r.collidepoint(mpos):
-                        self.current = i
-                        break
-                if self._back_rect.collidepoint(mpos):
-                    # go back to main menu
-                    try:
-                        self.owner._change_state(MenuState.MAIN)
-                    except Exception:
-                        # fallback: try any back method
-                        if hasattr(self.owner, "back_to_menu"):
-                            self.owner.back_to_menu()
-
-        self._last_mouse_pressed = mouse_pressed
-
-        # keyboard support (left/right) with small debounce
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT]:
-            self.current = (self.current - 1) % self.num_pages
-            pygame.time.delay(120)
-        elif keys[pygame.K_RIGHT]:
-            self.current = (self.current + 1) % self.num_pages
-            pygame.time.delay(120)
+        self._prefetch_neighbours()
 
 
 
 class Menu:
     def __init__(self, width: int = 1200, height: int = 700):
         pygame.init()
-        icon_image = pygame.image.load(r'assets\images\pieces\pong.ico')
+        icon_image = _cached_load(r'assets\images\pieces\pong.ico')
         pygame.display.set_icon(icon_image)
         self.W, self.H = width, height
         self.screen = pygame.display.set_mode((self.W, self.H))
@@ -577,10 +963,10 @@ class Menu:
         self.clock = pygame.time.Clock()
 
         # Fonts
-        self.font_title = pygame.font.SysFont("consolas", 72, bold=True)
-        self.font_subtitle = pygame.font.SysFont("consolas", 32, bold=True)
-        self.font_normal = pygame.font.SysFont("consolas", 24)
-        self.font_small = pygame.font.SysFont("consolas", 18)
+        self.font_title = get_font("consolas", 72, bold=True)
+        self.font_subtitle = get_font("consolas", 32, bold=True)
+        self.font_normal = get_font("consolas", 24)
+        self.font_small = get_font("consolas", 18)
 
         # State
         self.state = MenuState.MAIN
@@ -594,10 +980,14 @@ class Menu:
         self._current_music_theme = None 
 
         # Load saved theme preference
-        import storage
         prefs = storage.load_preferences()
+        # Kept in memory; volume changes are written back once via _flush_prefs()
+        self._prefs = prefs
+        self._prefs_dirty = False
+        self._volume_dirty = False  # slider moved since the last _save_volume()
         theme_name = prefs.get("theme", "default")
         self.theme_manager.set_current_theme(theme_name)
+        self._refresh_theme_view()
 
         # Settings
         self.settings = {
@@ -610,6 +1000,20 @@ class Menu:
             "volume": prefs.get("volume", 0.6),
         }
         self._pending_mode = None  # Store mode while selecting BO
+        # Pre-rendered text blit lists (rebuilt when settings/theme change)
+        self._info_text_cache = {}
+        self._subtitle_cache: Dict[Tuple[str, int], Tuple[pygame.Surface, Tuple[int, int]]] = {}
+        self._footer_cache: Dict[str, Tuple[pygame.Surface, pygame.Rect]] = {}
+        self._bo_subtitle: Optional[Tuple[tuple, str]] = None
+        self._button_layers: Dict[MenuState, tuple] = {}
+        self._button_columns: Dict[MenuState, tuple] = {}  # state -> (buttons, column geometry or None)
+        self._title_cache = None
+        self._rules_text_cache = None
+        self._rules_back_btn: Optional[Button] = None
+        self._credit_scaled: Optional[Tuple[pygame.Surface, Tuple[int, int]]] = None
+        self._credit_scaled_key = None
+        self._no_credit_surf = None
+        self._settings_panel: Optional[Tuple[tuple, pygame.Surface]] = None
         self._saved_difficulty = None  # Store difficulty for pvcpu mode
 
         # Background
@@ -621,6 +1025,11 @@ class Menu:
 
         # Initialize buttons
         self.buttons = {}
+        self._init_button_actions()
+        self._pickable_themes: Optional[List[Tuple[str, ThemeConfig]]] = None
+        self._theme_hover_colors: Dict[str, Tuple[int, int, int]] = {}  # theme id -> lightened accent
+        self._last_mouse_pressed = False  # edge detection for _draw_rules' back button
+        self.time_input: Optional[NumericInput] = None  # created with the TIME_SELECT buttons
         self._init_buttons()
         
         # Initialize volume slider
@@ -712,17 +1121,40 @@ class Menu:
         self._confirming_exit = False
         self._exit_yes_btn: Optional[Button] = None
         self._exit_no_btn: Optional[Button] = None
+        self._dim_overlay: Optional[pygame.Surface] = None
+        self._credits_bg: Optional[Tuple[tuple, pygame.Surface]] = None
+        self._dirty = True  # repaint needed on the next frame
+        self._full_redraw = True  # False: only dirty rects need presenting
+        self._credits_hover: Optional[bool] = None
+        self._static_frame: Optional[pygame.Surface] = None  # last full frame, buttons idle
+        self._hovered_btn: Optional[Button] = None
+        self._event_handlers = {
+            pygame.QUIT: self._on_quit,
+            pygame.KEYDOWN: self._on_keydown,
+            pygame.MOUSEBUTTONDOWN: self._on_mousedown,
+            pygame.MOUSEMOTION: self._on_mousemotion,
+            pygame.MOUSEBUTTONUP: self._on_mouseup,
+            pygame.WINDOWFOCUSLOST: self._on_window_state,
+            pygame.WINDOWFOCUSGAINED: self._on_window_state,
+            pygame.WINDOWMINIMIZED: self._on_window_state,
+            pygame.WINDOWRESTORED: self._on_window_state,
+        }
+        self._focused = True
+        self._minimized = False
+        self._exit_panel = None  # (theme name, pre-rendered panel surface, screen position)
 
         # Credits image
         self.credit_image = None
+        self._credit_path: Optional[str] = None
         self._load_credit_image()
 
     def _load_background(self):
         """Load background image for current theme"""
-        print(f"[Menu] _load_background called for theme: {self.theme_manager.current_theme_name}")
         theme = self.theme_manager.get_current_theme()
-        print(f"[Menu]   -> Theme name: {theme.name}")
-        print(f"[Menu]   -> Background image: {theme.background_image}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("[Menu] _load_background called for theme: %s", self.theme_manager.current_theme_name)
+            log.debug("[Menu]   -> Theme name: %s", theme.name)
+            log.debug("[Menu]   -> Background image: %s", theme.background_image)
 
         self.background_image = self.theme_manager.load_background(
             self.theme_manager.current_theme_name,
@@ -731,10 +1163,10 @@ class Menu:
         )
 
         if self.background_image:
-            print(
-                f"[Menu]   -> Background loaded successfully: {self.background_image.get_width()}x{self.background_image.get_height()}")
+            log.debug("[Menu]   -> Background loaded successfully: %dx%d",
+                      self.background_image.get_width(), self.background_image.get_height())
         else:
-            print(f"[Menu]   -> No background image loaded, using solid color: {theme.background_color}")
+            log.debug("[Menu]   -> No background image loaded, using solid color: %s", theme.background_color)
 
     def _load_credit_image(self):
         """Load credit image from assets/credit folder"""
@@ -743,38 +1175,54 @@ class Menu:
             print(f"[Menu] Credit directory not found: {credit_dir}")
             return
         
-        # Look for image files in the credit folder
+        # Look for the first image file in the credit folder
         image_extensions = (".png", ".jpg", ".jpeg", ".bmp", ".gif")
-        credit_files = [f for f in os.listdir(credit_dir) 
-                       if f.lower().endswith(image_extensions)]
-        
-        if not credit_files:
+        with os.scandir(credit_dir) as it:
+            credit_path = next((e.path for e in it
+                                if e.name.lower().endswith(image_extensions) and e.is_file()), None)
+
+        if credit_path is None:
             print(f"[Menu] No image files found in {credit_dir}")
             return
-        
-        # Load the first image found
-        credit_path = os.path.join(credit_dir, credit_files[0])
+
         try:
-            self.credit_image = pygame.image.load(credit_path).convert_alpha()
+            self.credit_image = _cached_load(credit_path)
+            self._credit_path = credit_path
+            self._scale_credit_image()
             print(f"[Menu] Credit image loaded: {credit_path}")
         except Exception as e:
             print(f"[Menu] Failed to load credit image: {e}")
             self.credit_image = None
 
     def _set_theme(self, theme_name: str):
+        if theme_name == self.theme_manager.current_theme_name and theme_name == self.settings.get("theme"):
+            return  # re-selecting the active theme: nothing to reload
         theme = self.theme_manager.get_theme(theme_name)
         if not theme or not getattr(theme, "selectable", True):
             return  # ignore music-only or invalid themes
+        old_colors = (self._tv.accent_color, self._tv.text_color)
         self.theme_manager.set_current_theme(theme_name)
+        self._refresh_theme_view()
         self.settings["theme"] = theme_name
+        self._settings_panel = None
         self._load_background()
         self._update_menu_music()
-        self._init_buttons()
+        if (self._tv.accent_color, self._tv.text_color) != old_colors:
+            self._init_buttons()
+        else:
+            # only the "* current" marker on the theme picker changed
+            self.buttons.pop(MenuState.THEME_SELECT, None)
         self._init_volume_slider()
 
     def _get_current_theme(self) -> ThemeConfig:
         """Get current theme config"""
         return self.theme_manager.get_current_theme()
+
+    def _refresh_theme_view(self):
+        """Snapshot the current theme's colours for the draw methods"""
+        t = self.theme_manager.get_current_theme()
+        self._tv = ThemeView(t.name, t.accent_color, t.text_color, t.background_color,
+                             t.board_color, t.music, t.selectable)
     
     def _update_menu_music(self):
         """Play the current theme's music on loop (menu only)."""
@@ -793,7 +1241,7 @@ class Menu:
         except Exception:
             pass
 
-        if music_path and os.path.exists(music_path):
+        if music_path and _music_exists(music_path):
             try:
                 pygame.mixer.music.load(music_path)
                 pygame.mixer.music.play(loops=-1)
@@ -818,96 +1266,90 @@ class Menu:
         self._current_music_theme = None
 
     def _init_buttons(self):
-        """Initialize all button layouts for different menu states"""
+        """Reset button layouts; each menu state's buttons are built on first use"""
+        self.buttons.clear()
+        self._button_factories = {
+            MenuState.MAIN: partial(self._make_column_buttons, MAIN_SPEC),
+            MenuState.MODE_SELECT: partial(self._make_column_buttons, MODE_SELECT_SPEC),
+            MenuState.BO_SELECT: partial(self._make_column_buttons, BO_SELECT_SPEC),
+            MenuState.DIFFICULTY: partial(self._make_column_buttons, DIFFICULTY_SPEC),
+            MenuState.SETTINGS: partial(self._make_column_buttons, SETTINGS_SPEC),
+            MenuState.BOARD_SIZE: partial(self._make_column_buttons, BOARD_SIZE_SPEC),
+            MenuState.TIME_SELECT: self._make_time_select_buttons,
+            MenuState.THEME_SELECT: self._make_theme_select_buttons,
+            MenuState.VOLUME_SETTINGS: self._make_volume_settings_buttons,
+            MenuState.CREDITS: self._make_credits_buttons,
+        }
+        # Main menu is shown first, so build it right away
+        self.get_buttons(MenuState.MAIN)
+
+    def get_buttons(self, state: MenuState) -> List[Button]:
+        """Return the buttons for a menu state, building them on first request"""
+        buttons = self.buttons.get(state)
+        if buttons is None:
+            factory = self._button_factories.get(state)
+            if factory is None:
+                return []
+            buttons = self.buttons[state] = factory()
+        return buttons
+
+    def _button_layout(self):
         btn_width, btn_height = 300, 60
         center_x = self.W // 2 - btn_width // 2
         start_y = 220
         spacing = 75
+        return btn_width, btn_height, center_x, start_y, spacing
+
+    def _init_button_actions(self):
+        """Callbacks referenced by the *_SPEC tables, keyed by action name"""
+        go = self._change_state
+        self._button_actions = {
+            "goto_main": partial(go, MenuState.MAIN),
+            "goto_mode_select": partial(go, MenuState.MODE_SELECT),
+            "goto_settings": partial(go, MenuState.SETTINGS),
+            "goto_rules": partial(go, MenuState.RULES),
+            "goto_how2play": partial(go, MenuState.HOW2PLAY),
+            "goto_credits": partial(go, MenuState.CREDITS),
+            "goto_difficulty": partial(go, MenuState.DIFFICULTY),
+            "goto_board_size": partial(go, MenuState.BOARD_SIZE),
+            "goto_time_select": partial(go, MenuState.TIME_SELECT),
+            "goto_theme_select": partial(go, MenuState.THEME_SELECT),
+            "goto_volume": partial(go, MenuState.VOLUME_SETTINGS),
+            "pvp": partial(go, MenuState.BO_SELECT, mode="pvp"),
+            "request_exit": self._request_exit,
+            "back_from_bo": self._back_from_bo_select,
+            "bo1": partial(self._set_best_of, 1),
+            "bo3": partial(self._set_best_of, 3),
+            "bo5": partial(self._set_best_of, 5),
+            "easy": partial(self._set_difficulty, "easy"),
+            "medium": partial(self._set_difficulty, "medium"),
+            "hard": partial(self._set_difficulty, "hard"),
+            "size9": partial(self._set_board_size, 9),
+            "size13": partial(self._set_board_size, 13),
+            "size15": partial(self._set_board_size, 15),
+        }
 
+    def _button_style(self, style: str, theme: ThemeConfig) -> dict:
+        if style == "accent":
+            return {"color": theme.accent_color, "text_color": theme.text_color}
+        color, hover_color = BUTTON_STYLES[style]
+        return {"color": color, "hover_color": hover_color, "text_color": BLACK}
+
+    def _make_column_buttons(self, spec) -> List[Button]:
+        """Build a vertical column of buttons from a (label, action, style) spec table"""
+        btn_width, btn_height, center_x, start_y, spacing = self._button_layout()
+        theme = self._get_current_theme()
+        actions = self._button_actions
+        return [Button(label, center_x, start_y + spacing * i, btn_width, btn_height,
+                       actions[action], **self._button_style(style, theme))
+                for i, (label, action, style) in enumerate(spec)]
+
+    def _make_time_select_buttons(self) -> List[Button]:
+        btn_width, btn_height, center_x, start_y, spacing = self._button_layout()
         theme = self._get_current_theme()
         accent = theme.accent_color
         text_color = theme.text_color
 
-        # Main Menu Buttons
-        self.buttons[MenuState.MAIN] = [
-            Button("Play", center_x, start_y, btn_width, btn_height,
-                   lambda: self._change_state(MenuState.MODE_SELECT), color=accent, text_color=text_color),
-            Button("Settings", center_x, start_y + spacing, btn_width, btn_height,
-                   lambda: self._change_state(MenuState.SETTINGS), color=accent, text_color=text_color),
-            Button("Rules", center_x, start_y + spacing * 2, btn_width, btn_height,
-                   lambda: self._change_state(MenuState.RULES), color=accent, text_color=text_color),
-            Button("How to Play", center_x, start_y + spacing * 3, btn_width, btn_height,
-                   lambda: self._change_state(MenuState.HOW2PLAY), color=accent, text_color=text_color),
-            Button("Credits", center_x, start_y + spacing * 4, btn_width, btn_height,
-                   lambda: self._change_state(MenuState.CREDITS), color=accent, text_color=text_color),
-            Button("Exit", center_x, start_y + spacing * 5, btn_width, btn_height,
-                   self._request_exit, color=RED, hover_color=(255, 100, 100), text_color=BLACK),
-
-        ]
-
-        # Mode Selection (from Play button)
-        self.buttons[MenuState.MODE_SELECT] = [
-            Button("Player vs Player", center_x, start_y, btn_width, btn_height,
-                   lambda: self._change_state(MenuState.BO_SELECT, mode="pvp"), color=GREEN,
-                   hover_color=(120, 255, 120), text_color=BLACK),
-            Button("Player vs CPU", center_x, start_y + spacing, btn_width, btn_height,
-                   lambda: self._change_state(MenuState.DIFFICULTY), color=BLUE, hover_color=(100, 170, 255),
-                   text_color=BLACK),
-            Button("Back", center_x, start_y + spacing * 2, btn_width, btn_height,
-                   lambda: self._change_state(MenuState.MAIN), color=GRAY, hover_color=LIGHT_GRAY, text_color=BLACK),
-        ]
-
-        # BO Selection (Best Of)
-        self.buttons[MenuState.BO_SELECT] = [
-            Button("BO1 (Single Game)", center_x, start_y, btn_width, btn_height,
-                   lambda: self._set_best_of(1), color=GREEN, hover_color=(120, 255, 120), text_color=BLACK),
-            Button("BO3 (Best of 3)", center_x, start_y + spacing, btn_width, btn_height,
-                   lambda: self._set_best_of(3), color=accent, text_color=text_color),
-            Button("BO5 (Best of 5)", center_x, start_y + spacing * 2, btn_width, btn_height,
-                   lambda: self._set_best_of(5), color=accent, text_color=text_color),
-            Button("Back", center_x, start_y + spacing * 3, btn_width, btn_height,
-                   lambda: self._back_from_bo_select(), color=GRAY, hover_color=LIGHT_GRAY, text_color=BLACK),
-        ]
-
-        # Difficulty Selection (for PvCPU mode - goes to BO selection next)
-        self.buttons[MenuState.DIFFICULTY] = [
-            Button("Easy", center_x, start_y, btn_width, btn_height,
-                   lambda: self._set_difficulty("easy"), color=GREEN, hover_color=(120, 255, 120), text_color=BLACK),
-            Button("Medium", center_x, start_y + spacing, btn_width, btn_height,
-                   lambda: self._set_difficulty("medium"), color=accent, text_color=text_color),
-            Button("Hard", center_x, start_y + spacing * 2, btn_width, btn_height,
-                   lambda: self._set_difficulty("hard"), color=RED, hover_color=(255, 100, 100), text_color=BLACK),
-            Button("Back", center_x, start_y + spacing * 3, btn_width, btn_height,
-                   lambda: self._change_state(MenuState.MODE_SELECT), color=GRAY, hover_color=LIGHT_GRAY, text_color=BLACK),
-        ]
-
-        # Settings Menu
-        self.buttons[MenuState.SETTINGS] = [
-            Button("Board Size", center_x, start_y, btn_width, btn_height,
-                   lambda: self._change_state(MenuState.BOARD_SIZE), color=accent, text_color=text_color),
-            Button("Time per Move", center_x, start_y + spacing, btn_width, btn_height,
-                   lambda: self._change_state(MenuState.TIME_SELECT), color=accent, text_color=text_color),
-            Button("Theme", center_x, start_y + spacing * 2, btn_width, btn_height,
-                   lambda: self._change_state(MenuState.THEME_SELECT), color=PURPLE, hover_color=(200, 120, 255),
-                   text_color=BLACK),
-            Button("Volume Setting", center_x, start_y + spacing * 3, btn_width, btn_height,
-                   lambda: self._change_state(MenuState.VOLUME_SETTINGS), color=accent, text_color=text_color),
-            Button("Back", center_x, start_y + spacing * 4, btn_width, btn_height,
-                   lambda: self._change_state(MenuState.MAIN), color=GRAY, hover_color=LIGHT_GRAY, text_color=BLACK),
-        ]
-
-        # Board Size Selection
-        self.buttons[MenuState.BOARD_SIZE] = [
-            Button("9 x 9", center_x, start_y, btn_width, btn_height,
-                   lambda: self._set_board_size(9), color=accent, text_color=text_color),
-            Button("13 x 13", center_x, start_y + spacing, btn_width, btn_height,
-                   lambda: self._set_board_size(13), color=accent, text_color=text_color),
-            Button("15 x 15", center_x, start_y + spacing * 2, btn_width, btn_height,
-                   lambda: self._set_board_size(15), color=accent, text_color=text_color),
-            Button("Back", center_x, start_y + spacing * 3, btn_width, btn_height,
-                   lambda: self._change_state(MenuState.MAIN), color=GRAY, hover_color=LIGHT_GRAY, text_color=BLACK),
-        ]
-
         # Time Selection
         """self.buttons[MenuState.TIME_SELECT] = [
             Button("10 seconds", center_x, start_y, btn_width, btn_height,
@@ -931,7 +1373,7 @@ class Menu:
         self.time_input = NumericInput(center_x + btn_width // 2, field_y, btn_width, btn_height,
                                default="20", color=accent, text_color=text_color, placeholder="seconds")
 
-        self.buttons[MenuState.TIME_SELECT] = [
+        return [
             Button("Confirm", center_x, field_y + int(spacing * 1.5), btn_width, btn_height,
                 lambda: self._set_time(self.time_input.get_value()),
                 color=accent, text_color=text_color),
@@ -941,6 +1383,8 @@ class Menu:
                 color=GRAY, hover_color=LIGHT_GRAY, text_color=BLACK),
         ]
 
+    def _make_theme_select_buttons(self) -> List[Button]:
+        btn_width, btn_height, center_x, start_y, spacing = self._button_layout()
 
         # Theme Selection  ── FINAL BLOCK ──────────────────────────────────────
         theme_buttons = []
@@ -950,19 +1394,7 @@ class Menu:
         start_x = self.W // 2 - (themes_per_row * small_btn_width + (themes_per_row - 1) * 20) // 2
         row_y = start_y
 
-        all_themes = self.theme_manager.get_all_themes()
-
-        def _is_pickable_theme(t):
-            # must explicitly be selectable (fallback True)
-            if not getattr(t, "selectable", True):
-                return False
-            # must have a background image that actually exists
-            bg = getattr(t, "background_image", None)
-            return isinstance(bg, str) and os.path.exists(bg)
-
-        # only show REAL UI themes, not music-only packs
-        theme_items = [(tid, t) for tid, t in all_themes.items() if _is_pickable_theme(t)]
-        theme_items.sort(key=lambda kv: kv[1].name.lower())
+        theme_items = self._get_pickable_themes()
 
         for idx, (theme_id, theme_obj) in enumerate(theme_items):
             col = idx % themes_per_row
@@ -979,7 +1411,7 @@ class Menu:
                     display_name, x, y, small_btn_width, small_btn_height,
                     action=(lambda tn=theme_id: self._set_theme_and_back(tn)),
                     color=theme_obj.accent_color,
-                    hover_color=tuple(min(c + 40, 255) for c in theme_obj.accent_color),
+                    hover_color=self._theme_hover_colors[theme_id],
                     text_color=theme_obj.text_color,
                 )
             )
@@ -995,12 +1427,45 @@ class Menu:
             )
         )
 
-        self.buttons[MenuState.THEME_SELECT] = theme_buttons
+        return theme_buttons
+
+    def _get_pickable_themes(self) -> List[Tuple[str, ThemeConfig]]:
+        """Selectable themes sorted by name; computed once until refresh_themes()"""
+        if self._pickable_themes is None:
+            # only show REAL UI themes, not music-only packs
+            items = [(tid, t) for tid, t in self.theme_manager.get_all_themes().items() if _is_pickable_theme(t)]
+            items.sort(key=lambda kv: kv[1].name.lower())
+            self._pickable_themes = items
+            self._theme_hover_colors = {tid: tuple(min(c + 40, 255) for c in t.accent_color) for tid, t in items}
+        return self._pickable_themes
+
+    def refresh_themes(self):
+        """Re-scan the theme list (call after themes are added or removed at runtime)"""
+        self._pickable_themes = None
+        refresh_theme_cache()
+        self.buttons.pop(MenuState.THEME_SELECT, None)
+
+    def _make_credits_buttons(self) -> List[Button]:
+        accent = self._tv.accent_color or ACCENT
+
+        def _lighten(color, amount):
+            return tuple(min(255, int(c + amount)) for c in color)
+
+        # Drawn by _draw_credits itself; registered here so the shared click path dispatches it
+        return [
+            Button("Back to Menu", self.W // 2 - 150, self.H - 90, 300, 50,
+                   self._button_actions["goto_main"],
+                   color=_lighten(accent, 60), hover_color=_lighten(accent, 90),
+                   text_color=BLACK, darken_on_hover=False),
+        ]
+
+    def _make_volume_settings_buttons(self) -> List[Button]:
+        btn_width, btn_height, center_x, start_y, spacing = self._button_layout()
 
         # Volume Settings Menu
-        self.buttons[MenuState.VOLUME_SETTINGS] = [
+        return [
             Button("Back", center_x, start_y + spacing * 4, btn_width, btn_height,
-                   lambda: self._change_state(MenuState.SETTINGS), color=GRAY, hover_color=LIGHT_GRAY, text_color=BLACK),
+                   self._button_actions["goto_settings"], color=GRAY, hover_color=LIGHT_GRAY, text_color=BLACK),
         ]
 
     def _init_volume_slider(self):
@@ -1009,6 +1474,8 @@ class Menu:
         center_x = self.W // 2
         slider_y = self.H // 2 - 50  # Center vertically
         theme = self._get_current_theme()
+        if self.volume_slider and self.volume_slider.accent_color == theme.accent_color:
+            return  # slider already styled for this theme
         
         volume = self.settings.get("volume", 0.6)
         self.volume_slider = VolumeSlider(
@@ -1031,7 +1498,16 @@ class Menu:
             self._change_state(MenuState.MAIN)
 
     def _change_state(self, new_state: MenuState, mode: Optional[str] = None):
+        if self.state == MenuState.VOLUME_SETTINGS and new_state != MenuState.VOLUME_SETTINGS:
+            if self._volume_dirty:
+                self._save_volume()
+            self._flush_prefs()
+        if new_state != self.state:
+            self.rules_screen.release_nav()
         self.state = new_state
+        self._dirty = True
+        self._full_redraw = True
+        self.get_buttons(new_state)  # materialize widgets (e.g. time_input) before the first frame
         if mode:
             self._pending_mode = mode
         elif new_state == MenuState.MODE_SELECT:
@@ -1039,6 +1515,7 @@ class Menu:
 
     def _set_best_of(self, best_of: int):
         """Called when user selects BO1, BO3, or BO5"""
+        self._flush_prefs()
         self.settings["best_of"] = best_of
         mode = self._pending_mode or "pvp"
         self._pending_mode = None
@@ -1053,24 +1530,13 @@ class Menu:
         
         # Ensure difficulty is set and valid for pvcpu mode
         if mode == "pvcpu":
-            if "difficulty" not in self.settings or self.settings["difficulty"] not in ["easy", "medium", "hard"]:
-                # Use saved difficulty or default to medium
-                if self._saved_difficulty and self._saved_difficulty in ["easy", "medium", "hard"]:
-                    self.settings["difficulty"] = self._saved_difficulty
-                else:
-                    self.settings["difficulty"] = "medium"
-                    print(f"[Menu] Difficulty not set or invalid for pvcpu mode, defaulting to 'medium'")
-            # Also update saved difficulty to ensure it's preserved
-            if self.settings.get("difficulty") in ["easy", "medium", "hard"]:
-                self._saved_difficulty = self.settings["difficulty"]
+            self._coerce_difficulty()
 
         # If the external char select helper exists, use it
         if 'show_character_select' in globals() and show_character_select:
             try:
                 # Pass difficulty to character select for pvcpu mode
-                difficulty_for_char_select = None
-                if mode == "pvcpu":
-                    difficulty_for_char_select = self.settings.get("difficulty") or self._saved_difficulty or "medium"
+                difficulty_for_char_select = self.settings["difficulty"] if mode == "pvcpu" else None
                 res = show_character_select(mode=mode, difficulty=difficulty_for_char_select)
             except Exception as e:
                 print(f"[Menu] show_character_select failed: {e}")
@@ -1083,24 +1549,12 @@ class Menu:
 
             # merge returned values into settings (res should contain player names and chars)
             # But preserve difficulty for pvcpu mode (don't let it be overwritten)
-            saved_diff = self.settings.get("difficulty") or self._saved_difficulty
-            # Remove difficulty from res if it exists and is invalid, so we can preserve the saved one
-            if mode == "pvcpu" and res.get("difficulty") not in ["easy", "medium", "hard"]:
-                res.pop("difficulty", None)  # Remove invalid difficulty from res
+            saved_diff = self.settings.get("difficulty")
             self.settings.update(res)
             # make sure mode/difficulty are set (preserve difficulty for pvcpu)
             self.settings["mode"] = mode
             if mode == "pvcpu":
-                # Always preserve difficulty for pvcpu mode - don't let it be None or invalid
-                if saved_diff and saved_diff in ["easy", "medium", "hard"]:
-                    self.settings["difficulty"] = saved_diff
-                elif "difficulty" not in self.settings or self.settings.get("difficulty") not in ["easy", "medium", "hard"]:
-                    self.settings["difficulty"] = "medium"
-                    print(f"[Menu] Ensuring difficulty is set to 'medium' for pvcpu mode")
-                # Final validation - ensure it's always valid
-                if self.settings.get("difficulty") not in ["easy", "medium", "hard"]:
-                    self.settings["difficulty"] = "medium"
-                    print(f"[Menu] Final validation: setting difficulty to 'medium'")
+                self._coerce_difficulty(saved_diff)
 
             # Save volume before closing
             if self.volume_slider:
@@ -1120,6 +1574,7 @@ class Menu:
         Called when user chooses Player vs Player from main menu.
         If char selector is available we open it first; otherwise fallback to old behavior.
         """
+        self._flush_prefs()
         # stop/transition music as before
         try:
             pygame.mixer.music.fadeout(250)
@@ -1162,13 +1617,28 @@ class Menu:
         self.running = False
 
 
+    def _coerce_difficulty(self, preferred: Optional[str] = None) -> str:
+        """Pick the first valid difficulty (preferred, current, saved) and store it"""
+        if preferred in _VALID_DIFF:
+            d = preferred
+        elif self.settings.get("difficulty") in _VALID_DIFF:
+            d = self.settings["difficulty"]
+        elif self._saved_difficulty in _VALID_DIFF:
+            d = self._saved_difficulty
+        else:
+            d = "medium"
+            print(f"[Menu] Difficulty not set or invalid for pvcpu mode, defaulting to 'medium'")
+        self.settings["difficulty"] = d
+        self._saved_difficulty = d
+        return d
+
     def _set_difficulty(self, difficulty: str):
         """
         Called when user selects difficulty from DIFFICULTY menu (Player vs CPU).
         Now goes to BO selection first, then character select.
         """
         # Validate difficulty
-        if difficulty not in ["easy", "medium", "hard"]:
+        if difficulty not in _VALID_DIFF:
             print(f"[Menu] Invalid difficulty '{difficulty}', defaulting to 'medium'")
             difficulty = "medium"
         self.settings["difficulty"] = difficulty
@@ -1177,20 +1647,27 @@ class Menu:
 
     def _set_board_size(self, size: int):
         self.settings["board_size"] = size
+        self._settings_panel = None
         self._change_state(MenuState.SETTINGS)
 
     def _set_time(self, seconds: int):
         self.settings["per_move_seconds"] = seconds
+        self._settings_panel = None
         self._change_state(MenuState.SETTINGS)
 
     def _save_volume(self):
-        """Save current volume to preferences"""
+        """Record current volume in preferences (written to disk by _flush_prefs)"""
+        self._volume_dirty = False
         if self.volume_slider:
             self.settings["volume"] = self.volume_slider.get_volume()
-            import storage
-            prefs = storage.load_preferences()
-            prefs["volume"] = self.settings["volume"]
-            storage.save_preferences(prefs)
+            self._prefs["volume"] = self.settings["volume"]
+            self._prefs_dirty = True
+
+    def _flush_prefs(self):
+        """Write pending preference changes to disk, if any"""
+        if self._prefs_dirty:
+            storage.save_preferences(self._prefs)
+            self._prefs_dirty = False
 
     def _set_theme_and_back(self, theme_name: str):
         self._set_theme(theme_name)
@@ -1201,6 +1678,7 @@ class Menu:
         """Open the confirmation modal instead of quitting instantly."""
         self._confirming_exit = True
         self._build_exit_buttons()
+        self._build_exit_panel()
 
     def _cancel_exit(self):
         """Close the confirmation modal (do not quit)."""
@@ -1211,12 +1689,8 @@ class Menu:
     def _confirm_exit(self):
         """Actually quit."""
         # Save volume before exiting
-        if self.volume_slider:
-            self.settings["volume"] = self.volume_slider.get_volume()
-            import storage
-            prefs = storage.load_preferences()
-            prefs["volume"] = self.settings["volume"]
-            storage.save_preferences(prefs)
+        self._save_volume()
+        self._flush_prefs()
         self._stop_menu_music()
         self.running = False
         self.result = None
@@ -1234,33 +1708,44 @@ class Menu:
             action=self._cancel_exit, color=GRAY, hover_color=LIGHT_GRAY, text_color=BLACK
         )
 
-    def _draw_exit_modal(self, mouse_pos):
-        """Dim the scene and draw the themed confirmation box."""
-        theme = self._get_current_theme()
-
-        # darken background
-        dim = pygame.Surface((self.W, self.H), pygame.SRCALPHA)
-        dim.fill((0, 0, 0, 140))
-        self.screen.blit(dim, (0, 0))
+    def _build_exit_panel(self):
+        """Pre-render the modal box (panel, border and text) for the current theme."""
+        theme = self._tv
+        if self._exit_panel is not None and self._exit_panel[0] == theme.name:
+            return
 
         # modal rect (uses board color)
         box_w, box_h = 560, 260
         box_x = (self.W - box_w) // 2
         box_y = (self.H - box_h) // 2
-        box = pygame.Rect(box_x, box_y, box_w, box_h)
+        panel = pygame.Surface((box_w, box_h), pygame.SRCALPHA)
+        box = panel.get_rect()
 
         # board-like panel
-        pygame.draw.rect(self.screen, theme.board_color, box, border_radius=14)
-        pygame.draw.rect(self.screen, theme.accent_color, box, width=3, border_radius=14)
+        pygame.draw.rect(panel, theme.board_color, box, border_radius=14)
+        pygame.draw.rect(panel, theme.accent_color, box, width=3, border_radius=14)
 
         # text
         title = self.font_subtitle.render("Exit Game?", True, theme.text_color)
-        title_rect = title.get_rect(center=(self.W // 2, box_y + 60))
-        self.screen.blit(title, title_rect)
+        panel.blit(title, title.get_rect(center=(box_w // 2, 60)))
 
         msg = self.font_normal.render("Are you sure you want to quit?", True, theme.text_color)
-        msg_rect = msg.get_rect(center=(self.W // 2, box_y + 110))
-        self.screen.blit(msg, msg_rect)
+        panel.blit(msg, msg.get_rect(center=(box_w // 2, 110)))
+
+        self._exit_panel = (theme.name, panel.convert_alpha(), (box_x, box_y))
+
+    def _draw_exit_modal(self, mouse_pos):
+        """Dim the scene and draw the themed confirmation box."""
+        # darken background
+        if self._dim_overlay is None:
+            self._dim_overlay = pygame.Surface((self.W, self.H), pygame.SRCALPHA)
+            self._dim_overlay.fill((0, 0, 0, 140))
+            self._dim_overlay = self._dim_overlay.convert_alpha()
+        self.screen.blit(self._dim_overlay, (0, 0))
+
+        self._build_exit_panel()
+        _, panel, panel_pos = self._exit_panel
+        self.screen.blit(panel, panel_pos)
 
         # draw buttons
         if self._exit_yes_btn and self._exit_no_btn:
@@ -1305,14 +1790,14 @@ class Menu:
 
 
     def _draw_background(self):
-        theme = self._get_current_theme()
+        theme = self._tv
         if self.background_image:
             self.screen.blit(self.background_image, (0, 0))
         else:
             self.screen.fill(theme.background_color)
 
-    def _draw_title(self):
-        theme = self._get_current_theme()
+    def _build_title(self, theme: ThemeView):
+        """Pre-render the title and its shadow for the current theme"""
         # Use alternate title color for 'forest' theme to improve contrast
         title_color = theme.accent_color
         try:
@@ -1320,68 +1805,184 @@ class Menu:
                 title_color = (245, 245, 245)
         except Exception:
             pass
-        title = self.font_title.render("GOMOKU", True, title_color)
+        title = self.font_title.render("GOMOKU", True, title_color).convert_alpha()
         title_rect = title.get_rect(center=(self.W // 2, 80))
 
-        shadow = self.font_title.render("GOMOKU", True, (100, 100, 100))
+        shadow = self.font_title.render("GOMOKU", True, (100, 100, 100)).convert_alpha()
         shadow_rect = shadow.get_rect(center=(self.W // 2 + 3, 83))
-        self.screen.blit(shadow, shadow_rect)
-        self.screen.blit(title, title_rect)
+        self._title_cache = (self.theme_manager.current_theme_name, [(shadow, shadow_rect), (title, title_rect)])
+
+    def _draw_title(self):
+        theme = self._tv
+        if self._title_cache is None or self._title_cache[0] != self.theme_manager.current_theme_name:
+            self._build_title(theme)
+        self.screen.blits(self._title_cache[1], doreturn=False)
 
         pygame.draw.line(self.screen, theme.accent_color,
                          (self.W // 2 - 250, 140),
                          (self.W // 2 + 250, 140), 4)
 
     def _draw_subtitle(self, text: str, y: int = 170):
-        theme = self._get_current_theme()
-        subtitle = self.font_subtitle.render(text, True, WHITE)  # Use white color for better visibility
-        subtitle_rect = subtitle.get_rect(center=(self.W // 2, y))
-        self.screen.blit(subtitle, subtitle_rect)
+        cached = self._subtitle_cache.get((text, y))
+        if cached is None:
+            subtitle = self.font_subtitle.render(text, True, WHITE)  # Use white color for better visibility
+            subtitle_rect = subtitle.get_rect(center=(self.W // 2, y))
+            cached = self._subtitle_cache[(text, y)] = (subtitle, subtitle_rect.topleft)
+        self.screen.blit(*cached)
+
+    def _bo_select_subtitle(self) -> str:
+        """Subtitle for BO_SELECT; rebuilt only when the mode or difficulty changes"""
+        difficulty = self.settings.get("difficulty")
+        key = (self._pending_mode, difficulty)
+        if self._bo_subtitle is None or self._bo_subtitle[0] != key:
+            mode_text = "Player vs Player" if self._pending_mode == "pvp" else "Player vs CPU"
+            difficulty_text = ""
+            if self._pending_mode == "pvcpu" and difficulty:
+                difficulty_text = f" - {difficulty.capitalize()} Difficulty"
+            self._bo_subtitle = (key, f"Select Match Format - {mode_text}{difficulty_text}")
+        return self._bo_subtitle[1]
+
+    def _draw_button_group(self, buttons: List[Button], mouse_pos: Tuple[int, int]):
+        """Blit a state's buttons as one pre-composited layer, then redraw the hovered one"""
+        if not buttons:
+            return
+        enabled = tuple(b.enabled for b in buttons)
+        cached = self._button_layers.get(self.state)
+        if cached is None or cached[0] is not buttons or cached[1] != enabled:
+            area = pygame.Rect(buttons[0].x, buttons[0].y, buttons[0].width + 4, buttons[0].height + 4)
+            area.unionall_ip([pygame.Rect(b.x, b.y, b.width + 4, b.height + 4) for b in buttons])  # + shadow
+            full = pygame.Surface((self.W, self.H), pygame.SRCALPHA)
+            for b in buttons:
+                b.draw(full, self.font_normal, (-1, -1))  # never hovered
+            area = area.clip(full.get_rect())
+            cached = (buttons, enabled, full.subsurface(area).convert_alpha(), area.topleft)
+            self._button_layers[self.state] = cached
+        self.screen.blit(cached[2], cached[3])
+
+        if self.state in _HOVER_ONLY_STATES:
+            # Snapshot the frame with every button idle; hover changes restore from it
+            if self._static_frame is None or self._static_frame.get_size() != self.screen.get_size():
+                self._static_frame = self.screen.copy()
+            else:
+                self._static_frame.blit(self.screen, (0, 0))
+
+        self._hovered_btn = self._hovered_button(buttons, mouse_pos)
+        if self._hovered_btn is not None:
+            self._hovered_btn.draw(self.screen, self.font_normal, mouse_pos)
+
+    @staticmethod
+    def _column_geometry(buttons: List[Button]) -> Optional[tuple]:
+        """(x0, x1, y0, pitch, height) if the buttons form an evenly spaced column, else None"""
+        first = buttons[0]
+        pitch = buttons[1].y - first.y if len(buttons) > 1 else first.height + 1
+        if pitch <= first.height:
+            return None
+        for i, b in enumerate(buttons):
+            if (b.x, b.width, b.height) != (first.x, first.width, first.height) or b.y != first.y + i * pitch:
+                return None
+        return (first.x, first.x + first.width, first.y, pitch, first.height)
+
+    def _hovered_button(self, buttons: List[Button], mouse_pos: Tuple[int, int]) -> Optional[Button]:
+        """The enabled button under the mouse; plain columns are resolved arithmetically"""
+        if not buttons:
+            return None
+        cached = self._button_columns.get(self.state)
+        if cached is None or cached[0] is not buttons:
+            cached = self._button_columns[self.state] = (buttons, self._column_geometry(buttons))
+        geom = cached[1]
+        if geom is None:
+            for b in buttons:
+                if b.enabled and b.is_hovered(mouse_pos):
+                    return b
+            return None
+        x0, x1, y0, pitch, height = geom
+        mx, my = mouse_pos
+        if not x0 <= mx <= x1:
+            return None
+        dy = my - y0
+        i = dy // pitch
+        if 0 <= i < len(buttons) and dy - i * pitch <= height and buttons[i].enabled:
+            return buttons[i]
+        return None
+
+    def _update_button_hover(self, mouse_pos: Tuple[int, int]):
+        """Repaint and present only the buttons whose hover state flipped"""
+        hovered = self._hovered_button(self.get_buttons(self.state), mouse_pos)
+        if hovered is self._hovered_btn:
+            return
+        dirty = []
+        if self._hovered_btn is not None:
+            old = self._hovered_btn
+            rect = pygame.Rect(old.x, old.y, old.width + 4, old.height + 4)  # + shadow
+            self.screen.blit(self._static_frame, rect.topleft, rect)
+            dirty.append(rect)
+        if hovered is not None:
+            hovered.draw(self.screen, self.font_normal, mouse_pos)
+            dirty.append(pygame.Rect(hovered.x, hovered.y, hovered.width + 4, hovered.height + 4))
+        self._hovered_btn = hovered
+        pygame.display.update(dirty)
 
     def _draw_info_text(self, lines: List[str], start_y: int = 250):
-        theme = self._get_current_theme()
-        for i, line in enumerate(lines):
-            text = self.font_normal.render(line, True, theme.text_color)
-            text_rect = text.get_rect(center=(self.W // 2, start_y + i * 35))
-            self.screen.blit(text, text_rect)
-
-    def _draw_current_settings(self):
-        theme = self._get_current_theme()
-        box_height = 50
-        box_y = 150
-
-        box_surface = pygame.Surface((self.W - 100, box_height))
-        box_surface.set_alpha(230)
-        box_surface.fill((250, 250, 250) if theme.background_color[0] > 128 else (50, 50, 55))
-        self.screen.blit(box_surface, (50, box_y))
-
-        pygame.draw.rect(self.screen, theme.accent_color,
-                         (50, box_y, self.W - 100, box_height), 2, border_radius=10)
+        theme = self._tv
+        key = (tuple(lines), start_y, theme.name)
+        cached = self._info_text_cache.get(key)
+        if cached is None:
+            cached = []
+            for i, line in enumerate(lines):
+                text = self.font_normal.render(line, True, theme.text_color)
+                text_rect = text.get_rect(center=(self.W // 2, start_y + i * 35))
+                cached.append((text, text_rect.topleft))
+            self._info_text_cache[key] = cached
+        self.screen.blits(cached, doreturn=False)
+
+    def _build_settings_panel(self, box_height: int):
+        """Bake the settings strip (background, border and labels) into one Surface"""
+        theme = self._tv
+        board_size = self.settings['board_size']
+        per_move = self.settings['per_move_seconds']
+        key = (board_size, per_move, theme.name)
+        if self._settings_panel is not None and self._settings_panel[0] == key:
+            return self._settings_panel[1]
+
+        box_w = self.W - 100
+        panel = pygame.Surface((box_w, box_height), pygame.SRCALPHA)
+        fill = (250, 250, 250) if theme.background_color[0] > 128 else (50, 50, 55)
+        panel.fill((*fill, 230))
+        pygame.draw.rect(panel, theme.accent_color, panel.get_rect(), 2, border_radius=10)
 
         settings_text = [
-            f"Board: {self.settings['board_size']}×{self.settings['board_size']}",
-            f"Time: {self.settings['per_move_seconds']}s/move",
+            f"Board: {board_size}×{board_size}",
+            f"Time: {per_move}s/move",
             f"Theme: {theme.name}"
         ]
-
-        section_width = (self.W - 100) / 3
+        section_width = box_w / 3
         for i, text in enumerate(settings_text):
             surf = self.font_small.render(text, True, theme.text_color)
-            x = 50 + section_width * i + section_width / 2
-            rect = surf.get_rect(center=(x, box_y + box_height / 2))
-            self.screen.blit(surf, rect)
+            x = section_width * i + section_width / 2
+            panel.blit(surf, surf.get_rect(center=(x, box_height / 2)))
+
+        panel = panel.convert_alpha()
+        self._settings_panel = (key, panel)
+        return panel
+
+    def _draw_current_settings(self):
+        box_y = 150
+        self.screen.blit(self._build_settings_panel(50), (50, box_y))
 
     def _draw_footer(self):
         footer_text = "Press ESC to go back"
         if self.state == MenuState.MAIN:
             footer_text = "Press ESC to exit"
 
-        surf = self.font_small.render(footer_text, True, WHITE)
-        rect = surf.get_rect(center=(self.W // 2, self.H - 25))
-        self.screen.blit(surf, rect)
+        cached = self._footer_cache.get(footer_text)
+        if cached is None:
+            surf = self.font_small.render(footer_text, True, WHITE)
+            cached = self._footer_cache[footer_text] = (surf, surf.get_rect(center=(self.W // 2, self.H - 25)))
+        self.screen.blit(*cached)
 
-    def _draw_rules(self):
-        theme = self._get_current_theme()
+    def _draw_rules(self, mouse_pos: Tuple[int, int], mouse_pressed: bool):
+        """Legacy text-only rules page; the caller passes the frame's mouse state"""
+        theme = self._tv
         self._draw_subtitle("Game Rules", 100)
 
         rules = [
@@ -1401,161 +2002,274 @@ class Menu:
             "  [ESC] Back to menu",
         ]
 
-        y = 160
-        for rule in rules:
-            if rule.startswith("•") or rule.startswith("  ["):
-                color = theme.accent_color
-            else:
-                color = theme.text_color
-            font = self.font_normal if rule.startswith("•") else self.font_small
-            text = font.render(rule, True, color)
-            self.screen.blit(text, (100, y))
-            y += 30 if rule else 15
-
-        back_btn = Button("Back to Menu", self.W // 2 - 150, self.H - 90, 300, 50,
-                          lambda: self._change_state(MenuState.MAIN),
-                          color=GRAY, hover_color=LIGHT_GRAY, text_color=BLACK)
-        back_btn.draw(self.screen, self.font_normal, pygame.mouse.get_pos())
-
-        mouse_pressed = pygame.mouse.get_pressed()[0]
-        if hasattr(self, '_last_mouse_pressed'):
-            if mouse_pressed and not self._last_mouse_pressed:
-                if back_btn.is_hovered(pygame.mouse.get_pos()) and back_btn.action:
-                    back_btn.action()
+        if self._rules_text_cache is None or self._rules_text_cache[0] != theme.name:
+            blits = []
+            y = 160
+            for rule in rules:
+                if rule.startswith("•") or rule.startswith("  ["):
+                    color = theme.accent_color
+                else:
+                    color = theme.text_color
+                font = self.font_normal if rule.startswith("•") else self.font_small
+                text = font.render(rule, True, color)
+                blits.append((text, (100, y)))
+                y += 30 if rule else 15
+            self._rules_text_cache = (theme.name, blits)
+        self.screen.blits(self._rules_text_cache[1], doreturn=False)
+
+        if self._rules_back_btn is None:
+            self._rules_back_btn = Button("Back to Menu", self.W // 2 - 150, self.H - 90, 300, 50,
+                                          lambda: self._change_state(MenuState.MAIN),
+                                          color=GRAY, hover_color=LIGHT_GRAY, text_color=BLACK)
+        back_btn = self._rules_back_btn
+        back_btn.draw(self.screen, self.font_normal, mouse_pos)
+
+        if mouse_pressed and not self._last_mouse_pressed:
+            if back_btn.is_hovered(mouse_pos) and back_btn.action:
+                back_btn.action()
         self._last_mouse_pressed = mouse_pressed
 
-    def _draw_credits(self):
-        theme = self._get_current_theme()
-        
-        # Draw dimmed background overlay but keep bottom area clear for back button
-        overlay_clearance = 140  # Height reserved for the back button area
-        overlay_height = max(0, self.H - overlay_clearance)
+    def _scale_credit_image(self):
+        """Fit the credit image to the window once; _draw_credits just blits the result"""
+        # Scale image to fit screen while maintaining aspect ratio
+        img_width, img_height = self.credit_image.get_size()
+
+        # Calculate scaling to fit within screen with some margin
+        max_width = self.W - 100
+        max_height = self.H - 150  # Leave space for back button
+
+        scale_w = max_width / img_width
+        scale_h = max_height / img_height
+        scale = min(scale_w, scale_h)  # Scale to fit, allow upscaling if needed
+
+        scaled_width = int(img_width * scale)
+        scaled_height = int(img_height * scale)
+
+        # Higher quality smoothscale, display-format result; shared by every Menu rebuilt after a match
+        scaled_image = load_and_convert(self._credit_path, (scaled_width, scaled_height))
+
+        # Center the image on screen
+        img_x = (self.W - scaled_width) // 2
+        img_y = (self.H - scaled_height - 50) // 2  # Offset a bit upward for back button
 
+        self._credit_scaled = (scaled_image, (img_x, img_y))
+        self._credit_scaled_key = (self.W, self.H, id(self.credit_image))
+
+    def _get_credits_bg(self) -> pygame.Surface:
+        """Background + dim overlay for CREDITS, composited once per theme background"""
+        key = (id(self.background_image), self._tv.background_color, self.W, self.H)
+        if self._credits_bg is None or self._credits_bg[0] != key:
+            bg = pygame.Surface((self.W, self.H)).convert()
+            if self.background_image:
+                bg.blit(self.background_image, (0, 0))
+            else:
+                bg.fill(self._tv.background_color)
+
+            # Dim everything but keep bottom area clear for back button
+            overlay_clearance = 140  # Height reserved for the back button area
+            overlay_height = max(0, self.H - overlay_clearance)
+            dim = pygame.Surface((self.W, overlay_height), pygame.SRCALPHA)
+            dim.fill((0, 0, 0, 180))
+            bg.blit(dim, (0, 0))
+            self._credits_bg = (key, bg)
+        return self._credits_bg[1]
+
+    def _get_credits_back_btn(self) -> Button:
+        """The credits "Back to Menu" button (rebuilt with the buttons on accent changes)"""
+        return self.get_buttons(MenuState.CREDITS)[0]
+
+    def _draw_credits(self, mouse_pos: Tuple[int, int]):
+        theme = self._tv
         
+        # Background with the dim overlay baked in: one opaque copy per frame
+        self.screen.blit(self._get_credits_bg(), (0, 0))
+
         # Draw credit image if available
         if self.credit_image:
-            # Scale image to fit screen while maintaining aspect ratio
-            img_width, img_height = self.credit_image.get_size()
-            
-            # Calculate scaling to fit within screen with some margin
-            max_width = self.W - 100
-            max_height = self.H - 150  # Leave space for back button
-            
-            scale_w = max_width / img_width
-            scale_h = max_height / img_height
-            scale = min(scale_w, scale_h)  # Scale to fit, allow upscaling if needed
-            
-            scaled_width = int(img_width * scale)
-            scaled_height = int(img_height * scale)
-            
-            # Scale the image
-            scaled_image = pygame.transform.smoothscale(self.credit_image, (scaled_width, scaled_height))
-            
-            # Center the image on screen
-            img_x = (self.W - scaled_width) // 2
-            img_y = (self.H - scaled_height - 50) // 2  # Offset a bit upward for back button
-            
-            self.screen.blit(scaled_image, (img_x, img_y))
+            if self._credit_scaled_key != (self.W, self.H, id(self.credit_image)):
+                self._scale_credit_image()
+            self.screen.blit(*self._credit_scaled)
         else:
-            # If no image, show a message
-            no_image_text = self.font_normal.render("No credit image found in assets/credit folder", True, theme.text_color)
-            text_rect = no_image_text.get_rect(center=(self.W // 2, self.H // 2))
-            self.screen.blit(no_image_text, text_rect)
+            # If no image, show a message (rendered once per text colour)
+            if self._no_credit_surf is None or self._no_credit_surf[0] != theme.text_color:
+                no_image_text = self.font_normal.render("No credit image found in assets/credit folder",
+                                                        True, theme.text_color).convert_alpha()
+                text_rect = no_image_text.get_rect(center=(self.W // 2, self.H // 2))
+                self._no_credit_surf = (theme.text_color, no_image_text, text_rect)
+            self.screen.blit(self._no_credit_surf[1], self._no_credit_surf[2])
 
         # Draw back button (fixed position at bottom)
-        accent = getattr(theme, "accent_color", ACCENT)
-        def _lighten(color, amount):
-            return tuple(min(255, int(c + amount)) for c in color)
+        back_btn = self._get_credits_back_btn()
+        back_btn.draw(self.screen, self.font_normal, mouse_pos)
+        self._credits_hover = back_btn.is_hovered(mouse_pos)
+
+    def _update_credits_hover(self, mouse_pos):
+        """Repaint and present only the credits back button when its hover state flips"""
+        back_btn = self._get_credits_back_btn()
+        hovered = back_btn.is_hovered(mouse_pos)
+        if hovered == self._credits_hover:
+            return
+        self._credits_hover = hovered
+        rect = pygame.Rect(back_btn.x, back_btn.y, back_btn.width + 4, back_btn.height + 4)  # + shadow
+        self.screen.blit(self._get_credits_bg(), rect.topleft, rect)
+        back_btn.draw(self.screen, self.font_normal, mouse_pos)
+        pygame.display.update(rect)
+
+    # ===== Event handlers (dispatched from run() via self._event_handlers) =====
+    def _on_quit(self, event, mouse_pos):
+        self._request_exit()
 
-        back_color = _lighten(accent, 60)
-        back_hover = _lighten(accent, 90)
+    def _on_window_state(self, event, mouse_pos):
+        # Backgrounded windows stop animating; minimized ones stop drawing altogether
+        if event.type == pygame.WINDOWFOCUSLOST:
+            self._focused = False
+            self.rules_screen.release_nav()  # its KEYUP goes to whichever window has focus now
+        elif event.type == pygame.WINDOWFOCUSGAINED:
+            self._focused = True
+        elif event.type == pygame.WINDOWMINIMIZED:
+            self._minimized = True
+        else:
+            self._minimized = False
 
-        back_btn = Button("Back to Menu", self.W // 2 - 150, self.H - 90, 300, 50,
-                          lambda: self._change_state(MenuState.MAIN),
-                          color=back_color, hover_color=back_hover, text_color=BLACK, darken_on_hover=False)
-        back_btn.draw(self.screen, self.font_normal, pygame.mouse.get_pos())
+    def _on_keydown(self, event, mouse_pos):
+        if self._confirming_exit:
+            if event.key in (pygame.K_RETURN, pygame.K_y):
+                self._confirm_exit()
+            elif event.key in (pygame.K_ESCAPE, pygame.K_n):
+                self._cancel_exit()
+            return  # don't propagate to normal handlers when modal is up
+
+        if event.key == pygame.K_ESCAPE:
+            self._handle_escape()
+
+        # TIME_SELECT: typing + Enter go to the numeric field
+        if (not self._confirming_exit) and self.state == MenuState.TIME_SELECT and self.time_input is not None:
+            if self.time_input.handle_event(event):
+                # Enter pressed -> confirm
+                self._set_time(self.time_input.get_value())
+
+    def _on_mousedown(self, event, mouse_pos):
+        if event.button != 1:
+            return
+        if self._confirming_exit:
+            # modal consumes the click
+            if self._exit_yes_btn and self._exit_yes_btn.is_hovered(mouse_pos):
+                self._exit_yes_btn.action()  # type: ignore
+            elif self._exit_no_btn and self._exit_no_btn.is_hovered(mouse_pos):
+                self._exit_no_btn.action()  # type: ignore
+            return
 
-        mouse_pressed = pygame.mouse.get_pressed()[0]
-        if hasattr(self, '_last_mouse_pressed'):
-            if mouse_pressed and not self._last_mouse_pressed:
-                if back_btn.is_hovered(pygame.mouse.get_pos()) and back_btn.action:
-                    back_btn.action()
-        self._last_mouse_pressed = mouse_pressed
+        # Volume slider handling
+        self._dispatch_slider(event)
+
+        # TIME_SELECT: click to focus the numeric field
+        if self.state == MenuState.TIME_SELECT and self.time_input is not None:
+            self.time_input.handle_event(event)
+
+        # normal buttons
+        button = self._hovered_button(self.get_buttons(self.state), mouse_pos)
+        if button is not None and button.action:
+            button.action()
+
+    def _on_mousemotion(self, event, mouse_pos):
+        # Handle volume slider dragging (plain hover motion never reaches the slider)
+        if self.volume_slider and self.volume_slider.dragging:
+            self._dispatch_slider(event)
+
+    def _on_mouseup(self, event, mouse_pos):
+        # Handle volume slider release
+        if event.button == 1:
+            self._dispatch_slider(event)
+
+    def _dispatch_slider(self, event):
+        """Feed a mouse event to the volume slider; record the level once the drag ends"""
+        if self.state != MenuState.VOLUME_SETTINGS or not self.volume_slider:
+            return
+        if self.volume_slider.handle_event(event):
+            self._volume_dirty = True
+            if event.type == pygame.MOUSEBUTTONUP:
+                self._save_volume()
 
     def run(self) -> Optional[dict]:
-        self._last_mouse_pressed = False
+        # remember the caller's filter so it can be put back exactly on exit
+        prev_blocked = [t for t in range(pygame.NUMEVENTS) if pygame.event.get_blocked(t)]
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(_MENU_EVENTS)
+        try:
+            self._run_loop()
+        finally:
+            pygame.event.set_allowed(None)
+            if prev_blocked:
+                pygame.event.set_blocked(prev_blocked)
+        return self.result
 
+    def _run_loop(self):
         while self.running:
-            dt = self.clock.tick(60) / 1000.0
+            paging = self.state == MenuState.RULES and self.rules_screen.nav_held
+            if not self._focused or self._minimized:
+                target_fps = _BACKGROUND_FPS
+            else:
+                target_fps = _STATIC_FPS if self.state in _STATIC_STATES and not paging else 60
+            animating = (self.state in _ANIMATED_STATES or paging) and self._focused
+            if self._minimized or not (self._dirty or animating):
+                # Nothing to animate: sleep inside SDL until input arrives or a frame passes
+                event = pygame.event.wait(1000 // target_fps)
+                dt = self.clock.tick() / 1000.0
+                events = [] if event.type == pygame.NOEVENT else [event]
+                events += pygame.event.get()
+            else:
+                dt = self.clock.tick(target_fps) / 1000.0
+                events = pygame.event.get()
             mouse_pos = pygame.mouse.get_pos()
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self._request_exit()
-
-                elif event.type == pygame.KEYDOWN and self._confirming_exit:
-                    if event.key in (pygame.K_RETURN, pygame.K_y):
-                        self._confirm_exit()
-                    elif event.key in (pygame.K_ESCAPE, pygame.K_n):
-                        self._cancel_exit()
-                    continue  # don't propagate to normal handlers when modal is up
-
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        self._handle_escape()
-                    
-                    # TIME_SELECT: typing + Enter go to the numeric field
-                    if (not self._confirming_exit) and self.state == MenuState.TIME_SELECT and hasattr(self, 'time_input'):
-                        if self.time_input.handle_event(event):
-                            # Enter pressed -> confirm
-                            self._set_time(self.time_input.get_value())
-
-                elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    if self._confirming_exit:
-                        # modal consumes the click
-                        if self._exit_yes_btn and self._exit_yes_btn.is_hovered(mouse_pos):
-                            self._exit_yes_btn.action()  # type: ignore
-                        elif self._exit_no_btn and self._exit_no_btn.is_hovered(mouse_pos):
-                            self._exit_no_btn.action()  # type: ignore
-                    else:
-                        # Volume slider handling
-                        if self.state == MenuState.VOLUME_SETTINGS and self.volume_slider:
-                            if self.volume_slider.handle_event(event):
-                                self._save_volume()
-                        
-                        # TIME_SELECT: click to focus the numeric field
-                        if self.state == MenuState.TIME_SELECT and hasattr(self, 'time_input'):
-                            self.time_input.handle_event(event)
-
-                        # normal buttons
-                        if self.state in self.buttons:
-                            for button in self.buttons[self.state]:
-                                if button.is_hovered(mouse_pos) and button.enabled and button.action:
-                                    button.action()
-                
-                elif event.type == pygame.MOUSEMOTION:
-                    # Handle volume slider dragging
-                    if self.state == MenuState.VOLUME_SETTINGS and self.volume_slider:
-                        if self.volume_slider.handle_event(event):
-                            self._save_volume()
-                
-                elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
-                    # Handle volume slider release
-                    if self.state == MenuState.VOLUME_SETTINGS and self.volume_slider:
-                        if self.volume_slider.handle_event(event):
-                            self._save_volume()
-
-
-            self._draw_background()
+            handlers = self._event_handlers
+            frame_state = self.state
+            # Only the newest MOUSEMOTION of a frame matters; drop the stale ones
+            last_motion = None
+            for event in reversed(events):
+                if event.type == pygame.MOUSEMOTION:
+                    last_motion = event
+                    break
+            for event in events:
+                if event.type == pygame.MOUSEMOTION and event is not last_motion:
+                    continue
+                self._dirty = True  # any input may change hover/pressed visuals
+                if event.type != pygame.MOUSEMOTION:
+                    self._full_redraw = True
+                handler = handlers.get(event.type)
+                if handler:
+                    handler(event, mouse_pos)
+
+            # Page screens consume this frame's events, unless a handler just switched
+            # to them (the click that opened the screen must not also press inside it)
+            screen_events = events if self.state == frame_state else ()
+
+            # Nothing changed since the last present (or nothing is visible): keep the frame
+            if self._minimized or not (self._dirty or animating):
+                continue
+            self._dirty = False
+
+            # Motion-only frames: these screens are static apart from button hover
+            if not self._full_redraw and not self._confirming_exit:
+                if self.state == MenuState.CREDITS:
+                    self._update_credits_hover(mouse_pos)
+                    continue
+                if self.state in _HOVER_ONLY_STATES and self._static_frame is not None:
+                    self._update_button_hover(mouse_pos)
+                    continue
+            self._full_redraw = False
+
+            if self.state != MenuState.CREDITS:  # credits paints its own pre-dimmed copy
+                self._draw_background()
 
             if self.state == MenuState.RULES:
-                self.rules_screen.update_and_draw()
+                self.rules_screen.update_and_draw(screen_events, mouse_pos)
                 self._draw_footer()
             elif self.state == MenuState.HOW2PLAY:
-                self.how2play_screen.update_and_draw()
+                self.how2play_screen.update_and_draw(screen_events, mouse_pos)
                 self._draw_footer()
             elif self.state == MenuState.CREDITS:
-                self._draw_credits()
+                self._draw_credits(mouse_pos)
                 self._draw_footer()
             else:
                 self._draw_title()
@@ -1564,12 +2278,7 @@ class Menu:
                 if self.state == MenuState.VOLUME_SETTINGS:
                     self._draw_subtitle("Volume Setting", 170)
                 elif self.state == MenuState.BO_SELECT:
-                    mode_text = "Player vs Player" if self._pending_mode == "pvp" else "Player vs CPU"
-                    difficulty_text = ""
-                    if self._pending_mode == "pvcpu" and self.settings.get("difficulty"):
-                        diff = self.settings.get("difficulty", "").capitalize()
-                        difficulty_text = f" - {diff} Difficulty"
-                    self._draw_subtitle(f"Select Match Format - {mode_text}{difficulty_text}", 170)
+                    self._draw_subtitle(self._bo_select_subtitle(), 170)
                 elif self.state == MenuState.DIFFICULTY:
                     self._draw_subtitle("Select Difficulty - Player vs CPU", 170)
                 elif self.state == MenuState.MODE_SELECT:
@@ -1578,26 +2287,22 @@ class Menu:
                     self._draw_current_settings()
                 
                 # TIME_SELECT: draw the numeric input box
-                if self.state == MenuState.TIME_SELECT and hasattr(self, 'time_input'):
+                if self.state == MenuState.TIME_SELECT and self.time_input is not None:
                     self.time_input.draw(self.screen)
                 
                 # VOLUME_SETTINGS: draw the volume slider
                 if self.state == MenuState.VOLUME_SETTINGS and self.volume_slider:
-                    theme = self._get_current_theme()
+                    theme = self._tv
                     self.volume_slider.draw(self.screen, theme)
 
-                if self.state in self.buttons:
-                    for button in self.buttons[self.state]:
-                        button.draw(self.screen, self.font_normal, mouse_pos)
                 self._draw_footer()
+                self._draw_button_group(self.get_buttons(self.state), mouse_pos)
 
             if self._confirming_exit:
                 self._draw_exit_modal(mouse_pos)
 
             pygame.display.flip()
 
-        return self.result
-
 
 def show_menu() -> Optional[dict]:
     menu = Menu()